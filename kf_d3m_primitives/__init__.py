@@ -0,0 +1 @@
+from ._entry_cache import load_primitive
@@ -0,0 +1,74 @@
+"""
+Command line interface for kf-d3m-primitives
+
+Listing primitives and printing the version only read installed package metadata (or
+the cached entry point index), so they don't import any primitive module or the
+frameworks those modules depend on
+"""
+
+import sys
+import json
+from argparse import ArgumentParser
+
+from . import _entry_cache
+from ._entry_cache import load_index, load_primitive
+
+
+def _version():
+    """returns the installed version of this package
+
+    Raises:
+        LookupError: if the package isn't installed, e.g. when running from a source tree
+    """
+    return _entry_cache._distribution()[0]
+
+
+def main(argv=None):
+    parser = ArgumentParser(
+        prog="kf-d3m", description="Inspect the installed kf-d3m-primitives"
+    )
+    parser.add_argument(
+        "--version", action="store_true", help="Print the package version and exit"
+    )
+    parser.add_argument(
+        "-l",
+        "--list-primitives",
+        action="store_true",
+        help="List the python path and class of every registered primitive",
+    )
+    parser.add_argument(
+        "-i",
+        "--inspect",
+        metavar="NAME",
+        help="Load one primitive (e.g. time_series_forecasting.lstm.DeepAR) and print "
+        + "its json annotation",
+    )
+    args = parser.parse_args(argv)
+
+    if args.version:
+        try:
+            print(_version())
+        except LookupError as e:
+            parser.error(str(e))
+    elif args.list_primitives:
+        try:
+            index = load_index()
+        except LookupError as e:
+            parser.error(str(e))
+        for name, entry in sorted(index.items()):
+            print(f"d3m.primitives.{name}\t{entry['module']}:{entry['attr']}")
+    elif args.inspect:
+        try:
+            primitive = load_primitive(args.inspect)
+        except KeyError:
+            parser.error(f"No primitive named '{args.inspect}', see --list-primitives")
+        except LookupError as e:
+            parser.error(str(e))
+        print(json.dumps(primitive.metadata.to_json_structure(), indent=4))
+    else:
+        parser.print_help()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,210 @@
+"""
+On-disk index of this package's d3m.primitives entry points
+
+Resolving entry points reads installed package metadata. The index maps each
+primitive's python path to its module, class and source file once, so later lookups
+only stat entry_points.txt and the cached source files, then load the one module
+requested straight from its file
+"""
+
+import os
+import sys
+import json
+import hashlib
+import logging
+import importlib.util
+
+DISTRIBUTION = "kf-d3m-primitives"
+ENTRY_POINT_GROUP = "d3m.primitives"
+
+logger = logging.getLogger(__name__)
+
+
+def _distribution():
+    """returns the version, path of entry_points.txt (None if it can't be located) and
+    d3m.primitives entry points (name, target) of the installed distribution
+
+    Raises:
+        LookupError: if the distribution isn't installed, e.g. when running from a
+            source tree
+    """
+
+    not_installed = (
+        f"{DISTRIBUTION} is not installed, install it (e.g. pip install -e .) to "
+        + "register its primitives"
+    )
+    try:
+        from importlib import metadata
+    except ImportError:
+        import pkg_resources
+
+        try:
+            dist = pkg_resources.get_distribution(DISTRIBUTION)
+        except pkg_resources.DistributionNotFound:
+            raise LookupError(not_installed) from None
+        egg_info = getattr(dist, "egg_info", None)
+        entry_points_file = egg_info and os.path.join(egg_info, "entry_points.txt")
+        entry_map = dist.get_entry_map(ENTRY_POINT_GROUP)
+        targets = [
+            (name, f"{ep.module_name}:{ep.attrs[0]}") for name, ep in entry_map.items()
+        ]
+        return dist.version, entry_points_file, targets
+
+    try:
+        dist = metadata.distribution(DISTRIBUTION)
+    except metadata.PackageNotFoundError:
+        raise LookupError(not_installed) from None
+    entry_points_file = next(
+        (
+            str(dist.locate_file(f))
+            for f in dist.files or []
+            if f.name == "entry_points.txt"
+        ),
+        None,
+    )
+    targets = [
+        (ep.name, ep.value) for ep in dist.entry_points if ep.group == ENTRY_POINT_GROUP
+    ]
+    return dist.version, entry_points_file, targets
+
+
+def _cache_path():
+    """returns the path of the entry point index, under $XDG_CACHE_HOME or ~/.cache.
+    keyed on where this package is installed, so virtualenvs don't share an index"""
+
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    package_dir = os.path.dirname(os.path.abspath(__file__))
+    key = hashlib.sha1(package_dir.encode()).hexdigest()[:16]
+    return os.path.join(cache_home, "kf-d3m", f"entries-{key}.json")
+
+
+def _mtime(path):
+    """ modification time of path, None if it doesn't exist """
+    try:
+        return os.path.getmtime(path)
+    except (OSError, TypeError):
+        return None
+
+
+def entry_points():
+    """returns (name, target) for each d3m.primitives entry point registered by this
+    package, without loading any of them. empty if the package isn't installed"""
+
+    try:
+        return _distribution()[2]
+    except LookupError as e:
+        logger.warning(e)
+        return []
+
+
+def _build_index(entry_points_file, targets):
+    """resolves entry point targets into the index written to disk: the mtime of
+    entry_points.txt and {name: {module, attr, file, mtime}}"""
+
+    primitives = {}
+    for name, target in targets:
+        module, attr = target.split(":")
+        spec = importlib.util.find_spec(module)
+        if spec is None or spec.origin is None:
+            continue
+        primitives[name] = {
+            "module": module,
+            "attr": attr,
+            "file": spec.origin,
+            "mtime": os.path.getmtime(spec.origin),
+        }
+    return {
+        "entry_points": {"file": entry_points_file, "mtime": _mtime(entry_points_file)},
+        "primitives": primitives,
+    }
+
+
+def _is_current(index):
+    """the index is stale once entry_points.txt is rewritten or removed (entry points
+    were added or removed, or the package was reinstalled), or once any of its source
+    files is removed or rewritten"""
+
+    try:
+        entry_points = index["entry_points"]
+        mtimes = [(entry_points["file"], entry_points["mtime"])] + [
+            (entry["file"], entry["mtime"]) for entry in index["primitives"].values()
+        ]
+    except (KeyError, TypeError, AttributeError):
+        return False
+    return all(mtime is not None and _mtime(f) == mtime for f, mtime in mtimes)
+
+
+def load_index(refresh=False):
+    """returns the cached entry point index, rebuilding it from installed metadata and
+    rewriting it if it is missing, stale or refresh is set
+
+    Keyword Arguments:
+        refresh {bool} -- rebuild the index from installed metadata (default: {False})
+
+    Raises:
+        LookupError: if the index has to be rebuilt and the package isn't installed
+
+    Returns:
+        dict -- {python path (without d3m.primitives.): {module, attr, file, mtime}}
+    """
+
+    path = _cache_path()
+    if not refresh:
+        try:
+            with open(path) as f:
+                index = json.load(f)
+            if _is_current(index):
+                return index["primitives"]
+        except (OSError, ValueError):
+            pass
+
+    _, entry_points_file, targets = _distribution()
+    index = _build_index(entry_points_file, targets)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(index, f, indent=4)
+    except OSError as e:
+        logger.info(f"Could not write entry point index to {path}: {e}")
+    return index["primitives"]
+
+
+def load_primitive(name):
+    """imports and returns one primitive class by its python path, loading only the
+    module that defines it from its cached source file
+
+    Arguments:
+        name {str} -- python path, with or without the 'd3m.primitives.' prefix,
+            e.g. 'time_series_forecasting.lstm.DeepAR'
+
+    Raises:
+        KeyError: if this package doesn't register a primitive with that name
+        LookupError: if the package isn't installed
+
+    Returns:
+        type -- primitive class
+    """
+
+    if name.startswith(f"{ENTRY_POINT_GROUP}."):
+        name = name[len(ENTRY_POINT_GROUP) + 1 :]
+
+    index = load_index()
+    if name not in index:
+        index = load_index(refresh=True)
+    if name not in index:
+        raise KeyError(f"No primitive named '{name}' in {DISTRIBUTION}")
+
+    entry = index[name]
+    module = sys.modules.get(entry["module"])
+    if module is None:
+        spec = importlib.util.spec_from_file_location(entry["module"], entry["file"])
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[entry["module"]] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            del sys.modules[entry["module"]]
+            raise
+    return getattr(module, entry["attr"])
@@ -6,8 +6,6 @@ import logging
 
 import numpy as np
 import pandas as pd
-from Simon import Simon
-from Simon.penny.guesser import guess
 from d3m.primitive_interfaces.unsupervised_learning import (
     UnsupervisedLearnerPrimitiveBase,
 )
@@ -17,7 +15,11 @@ from d3m import container, utils
 from d3m.base import utils as base_utils
 from d3m.container import DataFrame as d3m_DataFrame
 from d3m.metadata import hyperparams, base as metadata_base, params
-import tensorflow as tf
+
+from ...lazy_import import lazy_import
+
+# tensorflow is imported when the primitive is first used, not when it is loaded
+tf = lazy_import("tensorflow")
 
 __author__ = "Distil"
 __version__ = "1.2.4"
@@ -267,7 +269,7 @@ class SimonPrimitive(
                 {"type": "PIP", "package": "cython", "version": "0.29.24"},
                 {
                     "type": metadata_base.PrimitiveInstallationType.PIP,
-                    "package_uri": "git+https://github.com/uncharted-distil/d3m-primitives.git@{git_commit}#egg=kf-d3m-primitives".format(
+                    "package_uri": "git+https://github.com/uncharted-distil/d3m-primitives.git@{git_commit}#egg=kf-d3m-primitives[nlp]".format(
                         git_commit=utils.current_git_commit(os.path.dirname(__file__)),
                     ),
                 },
@@ -664,6 +666,10 @@ class SimonPrimitive(
                        respective semantic type label
         """
 
+        # Simon builds on keras, so it is only imported once annotations are produced
+        from Simon import Simon
+        from Simon.penny.guesser import guess
+
         # load model checkpoint
         checkpoint_dir = (
             self._volumes["simon_models_1"] + "/simon_models_1/pretrained_models/"
@@ -4,7 +4,6 @@ import logging
 
 import numpy as np
 import pandas as pd
-import shap
 from sklearn.cluster import KMeans
 
 logger = logging.getLogger(__name__)
@@ -51,6 +50,8 @@ class Tree:
         max_dataset_size=1500,
     ) -> None:
 
+        import shap
+
         self.X = X
         self.model = model
         self.number_of_features = number_of_features
@@ -0,0 +1,25 @@
+import sys
+import importlib.util
+
+
+def lazy_import(name):
+    """returns module `name`, deferring its execution until one of its attributes is first
+    accessed, so that heavy frameworks (e.g. tensorflow) are only imported by primitives that
+    actually fit or produce with them
+
+    parent packages of a dotted name are imported eagerly, so this is meant for top-level
+    packages; import submodule members inside the methods that use them instead
+    """
+
+    if name in sys.modules:
+        return sys.modules[name]
+
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ImportError(f"No module named '{name}'", name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
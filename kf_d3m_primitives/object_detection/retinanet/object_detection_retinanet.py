@@ -4,24 +4,19 @@ import time
 from collections import OrderedDict
 import logging
 
-import keras
-import tensorflow as tf
 import pandas as pd
 import numpy as np
 from d3m import container, utils
 from d3m.container import DataFrame as d3m_DataFrame
 from d3m.metadata import base as metadata_base, hyperparams, params
 from d3m.primitive_interfaces.base import PrimitiveBase, CallResult
-from object_detection_retinanet import losses
-from object_detection_retinanet import models
-from object_detection_retinanet.models.retinanet import retinanet_bbox
-from object_detection_retinanet.preprocessing.csv_generator import CSVGenerator
-from object_detection_retinanet.utils.anchors import make_shapes_callback
-from object_detection_retinanet.utils.image import (
-    read_image_bgr,
-    preprocess_image,
-    resize_image,
-)
+
+from ...lazy_import import lazy_import
+
+# tensorflow and keras (and object_detection_retinanet, which builds on them) are imported
+# when the primitive is first used, not when it is loaded
+keras = lazy_import("keras")
+tf = lazy_import("tensorflow")
 
 __author__ = "Distil"
 __version__ = "0.1.1"
@@ -151,7 +146,7 @@ class ObjectDetectionRNPrimitive(PrimitiveBase[Inputs, Outputs, Params, Hyperpar
                 {"type": "PIP", "package": "cython", "version": "0.29.24"},
                 {
                     "type": metadata_base.PrimitiveInstallationType.PIP,
-                    "package_uri": "git+https://github.com/uncharted-distil/d3m-primitives.git@{git_commit}#egg=kf-d3m-primitives".format(
+                    "package_uri": "git+https://github.com/uncharted-distil/d3m-primitives.git@{git_commit}#egg=kf-d3m-primitives[vision]".format(
                         git_commit=utils.current_git_commit(os.path.dirname(__file__)),
                     ),
                 },
@@ -304,6 +299,8 @@ class ObjectDetectionRNPrimitive(PrimitiveBase[Inputs, Outputs, Params, Hyperpar
             prediction_model   : The model wrapped with utility functions to perform object detection
                                 (applies regression values and performs NMS).
         """
+        from object_detection_retinanet import losses
+        from object_detection_retinanet.models.retinanet import retinanet_bbox
 
         anchor_params = None
         num_anchors = None
@@ -328,6 +325,7 @@ class ObjectDetectionRNPrimitive(PrimitiveBase[Inputs, Outputs, Params, Hyperpar
         """
         Create generator for evaluation.
         """
+        from object_detection_retinanet.preprocessing.csv_generator import CSVGenerator
 
         validation_generator = CSVGenerator(
             self.annotations,
@@ -376,6 +374,8 @@ class ObjectDetectionRNPrimitive(PrimitiveBase[Inputs, Outputs, Params, Hyperpar
 
         Can choose to use validation generator.
         """
+        from object_detection_retinanet import models
+        from object_detection_retinanet.preprocessing.csv_generator import CSVGenerator
 
         # Create object that stores backbone information
         self.backbone = models.backbone(self.hyperparams["backbone"])
@@ -442,6 +442,14 @@ class ObjectDetectionRNPrimitive(PrimitiveBase[Inputs, Outputs, Params, Hyperpar
             outputs : A d3m dataframe container with the d3m index, image name, bounding boxes as
                       a string (8 coordinate format), and confidence scores.
         """
+        from object_detection_retinanet import models
+        from object_detection_retinanet.preprocessing.csv_generator import CSVGenerator
+        from object_detection_retinanet.utils.image import (
+            read_image_bgr,
+            preprocess_image,
+            resize_image,
+        )
+
         iou_threshold = (
             0.5  # Bounding box overlap threshold for false positive or true positive
         )
@@ -1,6 +1,8 @@
 import os.path
 import typing
 import types
+import threading
+from collections import OrderedDict
 
 import numpy as np
 import pandas as pd
@@ -31,6 +33,12 @@ Inputs = container.DataFrame
 Outputs = container.DataFrame
 # Module = typing.Union[ResNet, AMDIM]
 
+# inference models are only used in eval mode without gradients, so primitive instances
+# in a process (e.g. one per fold of a pipeline) share the most recently loaded copies
+_INFERENCE_MODELS = OrderedDict()
+_INFERENCE_MODELS_SIZE = 2
+_INFERENCE_MODELS_LOCK = threading.Lock()
+
 
 class Params(params.Params):
     pass
@@ -122,7 +130,7 @@ class RemoteSensingPretrainedPrimitive(
                 {"type": "PIP", "package": "cython", "version": "0.29.24"},
                 {
                     "type": metadata_base.PrimitiveInstallationType.PIP,
-                    "package_uri": "git+https://github.com/uncharted-distil/d3m-primitives.git@{git_commit}#egg=kf-d3m-primitives".format(
+                    "package_uri": "git+https://github.com/uncharted-distil/d3m-primitives.git@{git_commit}#egg=kf-d3m-primitives[torch]".format(
                         git_commit=utils.current_git_commit(os.path.dirname(__file__)),
                     ),
                 },
@@ -235,11 +243,40 @@ class RemoteSensingPretrainedPrimitive(
         self,
         volumes: typing.Dict[str, str] = None,
     ):
-        """load either amdim or moco inference model"""
+        """load either amdim or moco inference model, reusing it if it is one of the
+        most recently loaded models. evicted cuda models release their cached memory"""
+        if self.hyperparams["inference_model"] == "amdim":
+            weights_path = volumes["amdim_weights"]
+        elif self.hyperparams["inference_model"] == "moco":
+            weights_path = volumes["moco_weights"]
+        cache_key = (
+            self.hyperparams["inference_model"],
+            weights_path,
+            str(self.device),
+        )
+
+        # held while loading, so concurrent instances wait for one copy to load
+        with _INFERENCE_MODELS_LOCK:
+            if cache_key in _INFERENCE_MODELS:
+                _INFERENCE_MODELS.move_to_end(cache_key)
+                return _INFERENCE_MODELS[cache_key]
+
+            model = self._read_inference_model(weights_path)
+            _INFERENCE_MODELS[cache_key] = model
+            while len(_INFERENCE_MODELS) > _INFERENCE_MODELS_SIZE:
+                (_, _, device), evicted = _INFERENCE_MODELS.popitem(last=False)
+                del evicted
+                if device.startswith("cuda"):
+                    torch.cuda.empty_cache()
+            return model
+
+    def _read_inference_model(self, weights_path):
+        """ read amdim or moco weights onto device, in eval mode """
+
         if self.hyperparams["inference_model"] == "amdim":
-            model = amdim(volumes["amdim_weights"], map_location=self.device)
+            model = amdim(weights_path, map_location=self.device)
         elif self.hyperparams["inference_model"] == "moco":
-            model = moco_r50(volumes["moco_weights"], map_location=self.device)
+            model = moco_r50(weights_path, map_location=self.device)
 
             def forward(self, x):
                 """ Patch forward to eliminate pooling, flattening + fc """
@@ -259,7 +296,6 @@ class RemoteSensingPretrainedPrimitive(
 
         model = model.to(self.device)
         model = model.eval()
-
         return model
 
     def _aggregate_features(self, features, spatial_a=2.0, spatial_b=2.0):
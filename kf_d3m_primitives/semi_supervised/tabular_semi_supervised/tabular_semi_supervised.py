@@ -168,7 +168,7 @@ class TabularSemiSupervisedPrimitive(
                 {"type": "PIP", "package": "cython", "version": "0.29.24"},
                 {
                     "type": metadata_base.PrimitiveInstallationType.PIP,
-                    "package_uri": "git+https://github.com/uncharted-distil/d3m-primitives.git@{git_commit}#egg=kf-d3m-primitives".format(
+                    "package_uri": "git+https://github.com/uncharted-distil/d3m-primitives.git@{git_commit}#egg=kf-d3m-primitives[torch]".format(
                         git_commit=utils.current_git_commit(os.path.dirname(__file__)),
                     ),
                 },
@@ -10,18 +10,12 @@ from d3m.primitive_interfaces.supervised_learning import SupervisedLearnerPrimit
 from d3m import container, utils
 from d3m.metadata import hyperparams, base as metadata_base, params
 from d3m.exceptions import PrimitiveNotFittedError
-import tensorflow as tf
-from tensorflow.keras.optimizers import Adam
-from tensorflow.keras.models import Model
-from tensorflow.keras.utils import to_categorical
-from tensorflow.keras.callbacks import EarlyStopping
 from sklearn.preprocessing import LabelEncoder
 
-from ..utils.lstm_model_utils import (
-    generate_lstmfcn,
-    LSTMSequence,
-    LSTMSequenceTest,
-)
+from ...lazy_import import lazy_import
+
+# tensorflow is imported when the primitive is first used, not when it is loaded
+tf = lazy_import("tensorflow")
 
 __author__ = "Distil"
 __version__ = "1.2.1"
@@ -34,6 +28,13 @@ Inputs = container.DataFrame
 Outputs = container.DataFrame
 
 
+def _lstm_model_utils():
+    """ imports keras model utils, which subclass tensorflow layers, on first use """
+    from ..utils import lstm_model_utils
+
+    return lstm_model_utils
+
+
 class Params(params.Params):
     label_encoder: LabelEncoder
     output_columns: pd.Index
@@ -122,6 +123,15 @@ class Hyperparams(hyperparams.Hyperparams):
         ],
         description="number of epochs to wait before invoking early stopping criterion",
     )
+    onnx_inference = hyperparams.UniformBool(
+        default=False,
+        semantic_types=[
+            "https://metadata.datadrivendiscovery.org/types/ControlParameter"
+        ],
+        description="whether to export the fit model to ONNX next to its weights and make "
+        + "predictions with onnxruntime. Requires the tf2onnx and onnxruntime packages, "
+        + "otherwise predictions are made with keras",
+    )
 
 
 class LstmFcnPrimitive(
@@ -264,10 +274,10 @@ class LstmFcnPrimitive(
 
         # convert labels to categorical
         self._n_classes = len(np.unique(y_ind))
-        self._y_train = to_categorical(y_ind, self._n_classes)
+        self._y_train = tf.keras.utils.to_categorical(y_ind, self._n_classes)
 
         # instantiate classifier
-        clf = generate_lstmfcn(
+        clf = _lstm_model_utils().generate_lstmfcn(
             self._ts_sz,
             self._n_classes,
             lstm_dim=self.hyperparams["lstm_dim"],
@@ -290,7 +300,8 @@ class LstmFcnPrimitive(
         """
 
         # instantiate classifier and load saved weights
-        clf = generate_lstmfcn(
+        lstm_model_utils = _lstm_model_utils()
+        clf = lstm_model_utils.generate_lstmfcn(
             self._ts_sz,
             self._n_classes,
             lstm_dim=self.hyperparams["lstm_dim"],
@@ -298,7 +309,9 @@ class LstmFcnPrimitive(
             dropout=self.hyperparams["dropout_rate"],
         )
         clf.compile(
-            optimizer=Adam(lr=self.hyperparams["learning_rate"]),
+            optimizer=tf.keras.optimizers.Adam(
+                learning_rate=self.hyperparams["learning_rate"]
+            ),
             loss="categorical_crossentropy",
             metrics=["acc"],
         )
@@ -311,10 +324,12 @@ class LstmFcnPrimitive(
             y_train = self._y_train[: int(train_split)].astype("float32")
             x_val = self._X_train[int(train_split) :]
             y_val = self._y_train[int(train_split) :]
-            val_dataset = LSTMSequence(x_val, y_val, self.hyperparams["batch_size"])
+            val_dataset = lstm_model_utils.LSTMSequence(
+                x_val, y_val, self.hyperparams["batch_size"]
+            )
             iterations = self.hyperparams["epochs"]
             callbacks = [
-                EarlyStopping(
+                tf.keras.callbacks.EarlyStopping(
                     monitor="val_loss",
                     patience=self.hyperparams["early_stopping_patience"],
                     mode="min",
@@ -327,7 +342,9 @@ class LstmFcnPrimitive(
             y_train = self._y_train
             val_dataset = None
             callbacks = None
-        train_dataset = LSTMSequence(x_train, y_train, self.hyperparams["batch_size"])
+        train_dataset = lstm_model_utils.LSTMSequence(
+            x_train, y_train, self.hyperparams["batch_size"]
+        )
 
         # time training for 1 epoch so we can consider timeout argument thoughtfully
         if timeout:
@@ -373,6 +390,8 @@ class LstmFcnPrimitive(
         # maintain primitive state
         self._is_fit = True
         clf.save_weights(self.hyperparams["weights_filepath"])
+        if self.hyperparams["onnx_inference"]:
+            self._export_onnx(clf)
 
         # use fitting history to set CallResult return values
         if iterations_set:
@@ -409,16 +428,6 @@ class LstmFcnPrimitive(
         if not self._is_fit:
             raise PrimitiveNotFittedError("Primitive not fitted.")
 
-        # instantiate classifier and load saved weights
-        clf = generate_lstmfcn(
-            self._ts_sz,
-            self._n_classes,
-            lstm_dim=self.hyperparams["lstm_dim"],
-            attention=self.hyperparams["attention_lstm"],
-            dropout=self.hyperparams["dropout_rate"],
-        )
-        clf.load_weights(self.hyperparams["weights_filepath"])
-
         # find column with ts value through metadata
         grouping_column = self._get_cols(inputs.metadata)
 
@@ -426,11 +435,13 @@ class LstmFcnPrimitive(
         ts_sz = inputs.shape[0] // n_ts
         attribute_col = self._get_value_col(inputs.metadata)
         x_vals = inputs.iloc[:, attribute_col].values.reshape(n_ts, 1, ts_sz)
-        x_vals = tf.cast(x_vals, tf.float32)
-        test_dataset = LSTMSequenceTest(x_vals, self.hyperparams["batch_size"])
 
         # make predictions
-        preds = clf.predict(test_dataset)
+        preds = None
+        if self.hyperparams["onnx_inference"]:
+            preds = self._predict_onnx(x_vals.astype(np.float32))
+        if preds is None:
+            preds = self._predict_keras(x_vals)
         preds = self._label_encoder.inverse_transform(np.argmax(preds, axis=1))
 
         # create output frame
@@ -444,3 +455,69 @@ class LstmFcnPrimitive(
 
         # ok to set to True because we have checked that primitive has been fit
         return CallResult(result_df, has_finished=True)
+
+    def _predict_keras(self, x_vals):
+        """ instantiates classifier, loads weights saved in fit and makes predictions """
+
+        lstm_model_utils = _lstm_model_utils()
+        clf = lstm_model_utils.generate_lstmfcn(
+            self._ts_sz,
+            self._n_classes,
+            lstm_dim=self.hyperparams["lstm_dim"],
+            attention=self.hyperparams["attention_lstm"],
+            dropout=self.hyperparams["dropout_rate"],
+        )
+        clf.load_weights(self.hyperparams["weights_filepath"])
+
+        x_vals = tf.cast(x_vals, tf.float32)
+        test_dataset = lstm_model_utils.LSTMSequenceTest(
+            x_vals, self.hyperparams["batch_size"]
+        )
+        return clf.predict(test_dataset)
+
+    def _onnx_filepath(self):
+        """ path of ONNX model exported next to the weights saved in fit """
+        return os.path.splitext(self.hyperparams["weights_filepath"])[0] + ".onnx"
+
+    def _export_onnx(self, clf):
+        """ exports fit classifier to ONNX, produce falls back to keras if this fails """
+
+        onnx_filepath = self._onnx_filepath()
+        if os.path.isfile(onnx_filepath):
+            os.remove(onnx_filepath)
+
+        try:
+            import tf2onnx
+
+            tf2onnx.convert.from_keras(clf, output_path=onnx_filepath)
+        except Exception as e:
+            logger.warning(
+                f"Failed to export model to ONNX, using keras inference: {e}"
+            )
+
+    def _predict_onnx(self, x_vals):
+        """ makes predictions with ONNX model exported in fit, None if it is unavailable """
+
+        onnx_filepath = self._onnx_filepath()
+        if not os.path.isfile(onnx_filepath):
+            return None
+        try:
+            import onnxruntime as ort
+        except ImportError:
+            logger.info("onnxruntime is not installed, using keras inference")
+            return None
+
+        providers = [
+            provider
+            for provider in ("CUDAExecutionProvider", "CPUExecutionProvider")
+            if provider in ort.get_available_providers()
+        ]
+        session = ort.InferenceSession(onnx_filepath, providers=providers)
+        input_name = session.get_inputs()[0].name
+        batch_size = self.hyperparams["batch_size"]
+        return np.concatenate(
+            [
+                session.run(None, {input_name: x_vals[i : i + batch_size]})[0]
+                for i in range(0, x_vals.shape[0], batch_size)
+            ]
+        )
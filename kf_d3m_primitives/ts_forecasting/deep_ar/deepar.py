@@ -3,20 +3,19 @@ import os
 from pathlib import Path
 import logging
 import time
+import shutil
 from typing import List, Union, Dict, Tuple, Any
 from collections import OrderedDict
 
 import numpy as np
 import pandas as pd
-import mxnet as mx
-from gluonts.model.deepar import DeepAREstimator
-from gluonts.trainer import Trainer
 from d3m.primitive_interfaces.base import CallResult
 from d3m.primitive_interfaces.supervised_learning import SupervisedLearnerPrimitiveBase
 from d3m import container, utils
 from d3m.metadata import hyperparams, params, base as metadata_base
 from d3m.exceptions import PrimitiveNotFittedError
 
+from ...lazy_import import lazy_import
 from ..utils.time_utils import (
     calculate_time_frequency,
     discretize_time_difference,
@@ -24,6 +23,9 @@ from ..utils.time_utils import (
 from .deepar_dataset import DeepARDataset
 from .deepar_forecast import DeepARForecast
 
+# mxnet and gluonts are imported when the primitive is first used, not when it is loaded
+mx = lazy_import("mxnet")
+
 
 __author__ = "Distil"
 __version__ = "1.2.1"
@@ -34,6 +36,8 @@ Outputs = container.DataFrame
 
 logger = logging.getLogger(__name__)
 
+_NANOS_PER_UNIT = {"D": 86400 * 10 ** 9, "s": 10 ** 9}
+
 
 class Params(params.Params):
     deepar_dataset: DeepARDataset
@@ -203,6 +207,19 @@ class Hyperparams(hyperparams.Hyperparams):
         description="whether to pad predictions that aren't supported by the model "
         + "with 'np.nan' or with the last valid prediction",
     )
+    quantize_inference = hyperparams.UniformBool(
+        default=False,
+        semantic_types=[
+            "https://metadata.datadrivendiscovery.org/types/ControlParameter"
+        ],
+        description="whether to quantize the trained network to int8 (calibrated on training "
+        + "series) for faster cpu inference. Falls back to float32 inference when int8 "
+        + "quantization is not supported. With mxnet 1.6, quantize_net_v2 can't quantize "
+        + "the LSTM cells, which stay float32, so the speedup is limited to the layers "
+        + "around them. The exported network is reloaded with mxnet's default input "
+        + "names for exported blocks (data0, data1, ...), in the order of the predictor's "
+        + "input_names",
+    )
 
 
 class DeepArPrimitive(
@@ -237,7 +254,7 @@ class DeepArPrimitive(
                 {"type": "PIP", "package": "cython", "version": "0.29.24"},
                 {
                     "type": metadata_base.PrimitiveInstallationType.PIP,
-                    "package_uri": "git+https://github.com/uncharted-distil/d3m-primitives.git@{git_commit}#egg=kf-d3m-primitives".format(
+                    "package_uri": "git+https://github.com/uncharted-distil/d3m-primitives.git@{git_commit}#egg=kf-d3m-primitives[forecasting]".format(
                         git_commit=utils.current_git_commit(os.path.dirname(__file__)),
                     ),
                 },
@@ -256,9 +273,15 @@ class DeepArPrimitive(
 
         self._freq = None
         self._is_fit = False
-        self._all_preds = None
+        self._reset_preds()
+        self._predictor = None
+        self._predictor_serialized = True
+        self._ctx = None
 
     def get_params(self) -> Params:
+        # serialized synchronously: a background thread could be killed at interpreter
+        # exit, or race a pickle of these params, and leave a truncated predictor
+        self._serialize_predictor()
         return Params(
             deepar_dataset=self._deepar_dataset,
             timestamp_column=self._timestamp_column,
@@ -281,8 +304,13 @@ class DeepArPrimitive(
         self._output_column = params["output_column"]
         self._freq = params["freq"]
         self._reind_freq = params["reind_freq"]
+        self._reind_offset = pd.tseries.frequencies.to_offset(self._reind_freq)
         self._is_fit = params["is_fit"]
         self._min_trains = params["min_trains"]
+        self._index_min_trains()
+        self._predictor = None
+        self._predictor_serialized = True
+        self._reset_preds()
 
     def set_training_data(self, *, inputs: Inputs, outputs: Outputs) -> None:
         """Sets primitive's training data
@@ -301,8 +329,13 @@ class DeepArPrimitive(
         self._get_cols(frame)
         self._set_freq(frame)
         frame, self._min_trains, max_train_length, _ = self._reindex(frame)
+        self._index_min_trains()
         self._check_window_support(max_train_length)
 
+        # series are fed to gluonts as float32, so cast the numeric columns once up front
+        for col in frame.columns[self._real_columns + [self._target_column]]:
+            frame[col] = frame[col].astype(np.float32)
+
         self._deepar_dataset = DeepARDataset(
             frame,
             self._grouping_columns,
@@ -316,7 +349,8 @@ class DeepArPrimitive(
             self._target_semantic_types,
             self.hyperparams["count_data"],
         )
-        self._train_data = self._deepar_dataset.get_data()
+        self._train_data = self._load_train_data()
+        self._reset_preds()
 
     def fit(self, *, timeout: float = None, iterations: int = None) -> CallResult[None]:
         """Fits DeepAR model using training data from set_training_data and hyperparameters
@@ -335,6 +369,9 @@ class DeepArPrimitive(
         else:
             has_finished = False
 
+        from gluonts.model.deepar import DeepAREstimator
+        from gluonts.trainer import Trainer
+
         estimator = DeepAREstimator(
             freq=self._freq,
             prediction_length=self.hyperparams["prediction_length"],
@@ -346,6 +383,7 @@ class DeepArPrimitive(
             distr_output=self._deepar_dataset.get_distribution_type(),
             dropout_rate=self.hyperparams["dropout_rate"],
             trainer=Trainer(
+                ctx=self._get_ctx(),
                 epochs=iterations,
                 learning_rate=self.hyperparams["learning_rate"],
                 batch_size=self.hyperparams["training_batch_size"],
@@ -355,14 +393,21 @@ class DeepArPrimitive(
 
         logger.info(f"Fitting for {iterations} iterations")
         start_time = time.time()
-        predictor = estimator.train(self._train_data)
+        predictor = estimator.train(
+            self._train_data, num_workers=self._get_num_workers()
+        )
         predictor.batch_size = self.hyperparams["inference_batch_size"]
         self._is_fit = True
         logger.info(f"Fit for {iterations} epochs, took {time.time() - start_time}s")
 
-        if not os.path.isdir(self.hyperparams["weights_dir"]):
-            os.mkdir(self.hyperparams["weights_dir"])
-        predictor.serialize(Path(self.hyperparams["weights_dir"]))
+        self._predictor = predictor
+        self._predictor_serialized = False
+        self._reset_preds()
+        if self.hyperparams["quantize_inference"]:
+            self._quantize(predictor)
+
+        # trace the prediction network into a static graph on its first forward pass
+        predictor.prediction_net.hybridize(static_alloc=True, static_shape=True)
 
         return CallResult(None, has_finished=has_finished)
 
@@ -386,18 +431,13 @@ class DeepArPrimitive(
             CallResult[Outputs] -- (N, 2) dataframe with d3m_index and value for each prediction slice requested.
                 prediction slice = specific horizon idx for specific series in specific regression
         """
-        if self._all_preds is None:
-            self._all_preds, self._pred_intervals = self._produce(inputs)
-
-        point_estimates = np.concatenate(
-            [
-                series[0][idxs]
-                for series, idxs in zip(self._all_preds, self._pred_intervals)
-            ]
-        )
+        self._update_preds(inputs)
+        if self._point_estimates is None:
+            series_idxs, horizon_idxs = self._get_pred_idxs()
+            self._point_estimates = self._all_preds[series_idxs, 0, horizon_idxs]
 
         result_df = container.DataFrame(
-            {self._output_column: point_estimates},
+            {self._output_column: self._point_estimates},
             generate_metadata=True,
         )
 
@@ -434,21 +474,17 @@ class DeepArPrimitive(
                  6   |   4  |   8
         """
 
-        if self._all_preds is None:
-            self._all_preds, self._pred_intervals = self._produce(inputs)
-
-        all_quantiles = [[] for q in range(len(self.hyperparams["quantiles"]) + 1)]
-        for series, idxs in zip(self._all_preds, self._pred_intervals):
-            for i, quantile in enumerate(series):
-                all_quantiles[i].append(quantile[idxs])
-        all_quantiles = [np.concatenate(quantile) for quantile in all_quantiles]
-
+        self._update_preds(inputs)
         col_names = (0.5,) + self.hyperparams["quantiles"]
+        if len(col_names) == 1 and self._point_estimates is not None:
+            # only the point estimates were requested, reuse the ones from produce
+            all_quantiles = self._point_estimates[:, np.newaxis]
+        else:
+            series_idxs, horizon_idxs = self._get_pred_idxs()
+            all_quantiles = self._all_preds[series_idxs, :, horizon_idxs]
+
         result_df = container.DataFrame(
-            {
-                col_name: quantile
-                for col_name, quantile in zip(col_names, all_quantiles)
-            },
+            {col_name: all_quantiles[:, i] for i, col_name in enumerate(col_names)},
             generate_metadata=True,
         )
 
@@ -459,6 +495,128 @@ class DeepArPrimitive(
 
         return CallResult(result_df, has_finished=self._is_fit)
 
+    def _update_preds(self, inputs):
+        """predicts inputs, unless they are the inputs of the predictions already cached
+        by produce or produce_confidence_intervals"""
+
+        if self._all_preds is None or inputs is not self._preds_inputs:
+            self._all_preds, self._pred_intervals = self._produce(inputs)
+            self._preds_inputs = inputs
+            self._point_estimates = None
+
+    def _reset_preds(self):
+        """ drops cached predictions, once the model they were made with changes """
+
+        self._all_preds = None
+        self._pred_intervals = None
+        self._point_estimates = None
+        self._preds_inputs = None
+
+    def _load_train_data(self):
+        """materializes the processed training series once, so that every fit on this
+        training set reuses them instead of re-running ProcessDataEntry on each pass"""
+
+        return list(self._deepar_dataset.get_data())
+
+    def _get_ctx(self):
+        """mxnet context to fit and predict on, resolved on first use so that constructing
+        the primitive doesn't import mxnet or initialize cuda"""
+
+        if self._ctx is None:
+            self._ctx = mx.gpu(0) if mx.context.num_gpus() > 0 else mx.cpu()
+        return self._ctx
+
+    def _get_num_workers(self):
+        """number of data loader worker processes for training, None to load batches in
+        this process. gluonts shards the training series across workers in equal parts
+        (the last worker takes the remainder) and cycles each shard, so only use a worker
+        count that divides the number of series, and don't fork workers on gpu"""
+
+        if self._get_ctx().device_type != "cpu":
+            return None
+        num_series = len(self._train_data)
+        max_workers = min(os.cpu_count() or 1, 4, num_series)
+        num_workers = max(
+            (w for w in range(1, max_workers + 1) if num_series % w == 0), default=1
+        )
+        return num_workers if num_workers > 1 else None
+
+    def _serialize_predictor(self):
+        """writes predictor fit in this process to weights_dir, so that it can be
+        loaded by _produce after this primitive is pickled and unpickled"""
+
+        if self._predictor_serialized:
+            return
+
+        if not os.path.isdir(self.hyperparams["weights_dir"]):
+            os.mkdir(self.hyperparams["weights_dir"])
+        self._predictor.serialize(Path(self.hyperparams["weights_dir"]))
+        self._predictor_serialized = True
+
+    def _quantize(self, predictor):
+        """quantizes prediction network to int8, calibrating on the first 100 training series,
+        and exports it to weights_dir/quantized. Inference stays float32 if this fails"""
+
+        quantized_dir = os.path.join(self.hyperparams["weights_dir"], "quantized")
+        shutil.rmtree(quantized_dir, ignore_errors=True)
+        ctx = self._get_ctx()
+        if ctx.device_type != "cpu":
+            logger.info("int8 quantization is only supported on cpu, skipping")
+            return
+
+        try:
+            from mxnet.contrib.quantization import quantize_net_v2
+            from gluonts.dataset.loader import InferenceDataLoader
+
+            calib_batches = list(
+                InferenceDataLoader(
+                    self._train_data[:100],
+                    transform=predictor.input_transform,
+                    batch_size=predictor.batch_size,
+                    ctx=ctx,
+                    dtype=predictor.dtype,
+                )
+            )
+            # inputs are named like those of an exported block, which
+            # DeepARForecast._load_quantized_net relies on to reload the network
+            calib_data = mx.io.NDArrayIter(
+                data={
+                    f"data{i}": mx.nd.concat(
+                        *[batch[name] for batch in calib_batches], dim=0
+                    )
+                    for i, name in enumerate(predictor.input_names)
+                },
+                batch_size=predictor.batch_size,
+            )
+            quantized_net = quantize_net_v2(
+                predictor.prediction_net,
+                quantized_dtype="int8",
+                calib_mode="entropy",
+                calib_data=calib_data,
+                ctx=ctx,
+                logger=logger,
+            )
+
+            # export requires one forward pass through the hybridized graph
+            quantized_net.hybridize()
+            quantized_net(*[calib_batches[0][name] for name in predictor.input_names])
+            os.makedirs(quantized_dir)
+            quantized_net.export(os.path.join(quantized_dir, "prediction_net"))
+        except Exception as e:
+            logger.warning(
+                f"Failed to quantize DeepAR network, using float32 inference: {e}"
+            )
+
+    def _get_pred_idxs(self):
+        """private util function: series and horizon index of each requested prediction,
+        for gathering them from the (series, quantile, horizon) predictions array"""
+
+        series_idxs = np.repeat(
+            np.arange(len(self._pred_intervals)),
+            [len(idxs) for idxs in self._pred_intervals],
+        )
+        return series_idxs, np.concatenate(self._pred_intervals)
+
     def _get_col_names(self, col_idxs, all_col_names):
         """ transform column indices to column names """
         return [all_col_names[i] for i in col_idxs]
@@ -474,25 +632,37 @@ class DeepArPrimitive(
             )
         return col_list[0]
 
-    def _sort_by_timestamp(self, frame):
-        """private util function: convert to pd datetime and sort"""
-
-        time_name = frame.columns[self._timestamp_column]
-        new_frame = frame.copy()
+    def _sort_by_timestamp(self, frame, codes):
+        """private util function: convert to pd datetime and sort by series code, then timestamp"""
 
+        times = frame.iloc[:, self._timestamp_column]
         if "http://schema.org/Integer" in frame.metadata.query_column_field(
             self._timestamp_column, "semantic_types"
         ):
-            new_frame.iloc[:, self._timestamp_column] = pd.to_datetime(
-                new_frame.iloc[:, self._timestamp_column] - 1, unit="D"
-            )
+            times = self._to_datetime(times - 1, unit="D")
             self._freq = "D"
             self._reind_freq = "D"
+            self._reind_offset = pd.tseries.frequencies.to_offset("D")
         else:
-            new_frame.iloc[:, self._timestamp_column] = pd.to_datetime(
-                new_frame.iloc[:, self._timestamp_column], unit="s"
+            times = self._to_datetime(times, unit="s")
+
+        # reorder rows by position into (series code, timestamp) order
+        order = np.lexsort((times.values.astype(np.int64), codes))
+        new_frame = frame.take(order)
+        new_frame.iloc[:, self._timestamp_column] = times.take(order)
+        return new_frame, codes[order]
+
+    @staticmethod
+    def _to_datetime(times, unit):
+        """private util function: convert numeric timestamps to pd datetime, skipping
+        the parser entirely for integer columns"""
+
+        if pd.api.types.is_integer_dtype(times.dtype):
+            ns = times.values.astype(np.int64) * _NANOS_PER_UNIT[unit]
+            return pd.Series(
+                ns.view("datetime64[ns]"), index=times.index, name=times.name
             )
-        return new_frame.sort_values(by=time_name)
+        return pd.to_datetime(times, unit=unit, cache=True)
 
     def _set_freq(self, frame):
         """sets frequency using differences in timestamp column in data frame
@@ -511,59 +681,160 @@ class DeepArPrimitive(
         else:
             if self._freq is None:
                 g_cols = self._get_col_names(self._grouping_columns, frame.columns)
-                for g, df in frame.groupby(g_cols, sort=False):
-                    diff = (
-                        df.iloc[1, self._timestamp_column]
-                        - df.iloc[0, self._timestamp_column]
-                    )
-                    break
+                keys = frame[g_cols]
+                first_key = keys.iloc[np.flatnonzero(keys.notna().all(axis=1))[0]]
+                first_rows = np.flatnonzero((keys == first_key).all(axis=1))[:2]
+                first_times = frame.iloc[first_rows, self._timestamp_column]
+                diff = first_times.iloc[1] - first_times.iloc[0]
                 self._freq, self._reind_freq = calculate_time_frequency(
                     diff, model="gluon"
                 )
+        self._reind_offset = pd.tseries.frequencies.to_offset(self._reind_freq)
+
+    def _get_series_bounds(self, codes):
+        """private util function: start and stop row of each series in frame sorted by series code"""
+
+        starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+        stops = np.r_[starts[1:], codes.shape[0]]
+        return starts, stops
+
+    def _interpolate(self, values, codes):
+        """linearly interpolate NA values within each series (by row position, like
+        pd.interpolate): leading NA values are kept, trailing NA values take the last valid value"""
+
+        rows = np.broadcast_to(np.arange(values.shape[0])[:, np.newaxis], values.shape)
+        cols = np.broadcast_to(np.arange(values.shape[1]), values.shape)
+        anchors = pd.DataFrame(np.where(np.isnan(values), np.nan, rows)).groupby(codes)
+        prev_valid = anchors.ffill().values
+        next_valid = anchors.bfill().values
+
+        leading = np.isnan(prev_valid)
+        prev_valid = np.where(leading, rows, prev_valid).astype(np.int64)
+        next_valid = np.where(np.isnan(next_valid), prev_valid, next_valid)
+        next_valid = next_valid.astype(np.int64)
+
+        span = next_valid - prev_valid
+        weights = np.divide(
+            rows - prev_valid,
+            span,
+            out=np.zeros(values.shape),
+            where=span > 0,
+        )
+        prev_values = values[prev_valid, cols]
+        interpolated = prev_values + weights * (values[next_valid, cols] - prev_values)
+        interpolated[leading] = np.nan
+        return interpolated
+
+    def _get_reindex_times(self, times, starts, stops):
+        """private util function: complete range of timestamps of each (sorted, de-duplicated)
+        series at reindexing frequency, concatenated, and the length of each range"""
+
+        offset = self._reind_offset
+        if isinstance(offset, pd.offsets.Tick):
+            # fixed frequency: fill all ranges into one buffer with integer arithmetic
+            times = times.astype(np.int64)
+            first, last = times[starts], times[stops - 1]
+            lengths = (last - first) // offset.nanos + 1
+            range_starts = np.cumsum(lengths) - lengths
+            steps = np.arange(lengths.sum()) - np.repeat(range_starts, lengths)
+            new_times = np.repeat(first, lengths) + steps * offset.nanos
+            return pd.DatetimeIndex(new_times.astype("datetime64[ns]")), lengths
+
+        new_times = [
+            pd.date_range(times[start], times[stop - 1], freq=offset)
+            if stop - start > 1
+            else pd.DatetimeIndex(times[start:stop])
+            for start, stop in zip(starts, stops)
+        ]
+        lengths = [len(series_times) for series_times in new_times]
+        if len(new_times) > 1:
+            new_times = new_times[0].append(new_times[1:])
+        else:
+            new_times = new_times[0]
+        return new_times, lengths
 
-    def _robust_reindex(self, frame):
-        """reindex dataframe IFF it has > 1 row, interpolate real-valued columns, forward-filling
-        categorical and grouping columns"""
+    def _robust_reindex(self, frame, codes):
+        """reindex each series IFF it has > 1 row, interpolate real-valued columns, forward-filling
+        categorical and grouping columns. Series are identified by the integer codes of their rows
+        and are all reindexed together. Also returns the original timestamps, sorted by series
+        code, with their codes"""
 
-        frame = self._sort_by_timestamp(frame)
+        frame, codes = self._sort_by_timestamp(frame, codes)
         original_times = frame.iloc[:, self._timestamp_column]
-        frame = frame.drop_duplicates(subset=frame.columns[self._timestamp_column])
-        frame.index = frame.iloc[:, self._timestamp_column]
-        if frame.shape[0] > 1:
-            frame = frame.reindex(
-                pd.date_range(
-                    frame.index[0],
-                    frame.index[-1],
-                    freq=self._reind_freq,
-                )
+        original_codes = codes
+        times = original_times.values
+        starts, stops = self._get_series_bounds(codes)
+
+        keep = np.r_[True, (codes[1:] != codes[:-1]) | (times[1:] != times[:-1])]
+        if not keep.all():
+            frame, codes, times = frame.iloc[keep], codes[keep], times[keep]
+            starts, stops = self._get_series_bounds(codes)
+        new_times, lengths = self._get_reindex_times(times, starts, stops)
+        new_codes = np.repeat(codes[starts], lengths)
+
+        # only reindex if some series are missing timestamps
+        if new_times.shape[0] == times.shape[0] and (new_times.values == times).all():
+            frame.index = new_times
+        else:
+            frame.index = pd.MultiIndex.from_arrays([codes, times])
+            frame = frame.reindex(pd.MultiIndex.from_arrays([new_codes, new_times]))
+            frame.index = new_times
+
+        real_values = frame.iloc[:, self._real_columns].values.astype(np.float64)
+        if np.isnan(real_values).any():
+            frame.iloc[:, self._real_columns] = self._interpolate(
+                real_values, new_codes
+            )
+        ffill_cols = self._cat_columns + self._grouping_columns
+        if frame.iloc[:, ffill_cols].isna().values.any():
+            frame.iloc[:, ffill_cols] = (
+                frame.iloc[:, ffill_cols].groupby(new_codes).ffill()
             )
-        frame.iloc[:, self._real_columns] = frame.iloc[
-            :, self._real_columns
-        ].interpolate()
-        frame.iloc[:, self._cat_columns + self._grouping_columns] = frame.iloc[
-            :, self._cat_columns + self._grouping_columns
-        ].ffill()
 
-        return frame, original_times
+        return frame, new_codes, original_times, original_codes
 
-    def _reindex(self, frame):
-        """reindex data, keeping NA values for target column, but interpolating feature columns"""
+    def _reindex(self, frame, pred_intervals=False):
+        """reindex data, keeping NA values for target column, but interpolating feature columns
+
+        if pred_intervals, also discretizes the original timestamps of each series against
+        the start of its training series in the same pass, otherwise returns None for them
+        """
 
         if len(self._grouping_columns) == 0:
-            df, original_times = self._robust_reindex(frame)
-            return df, [df.index[0]], df.shape[0], original_times
+            codes = np.zeros(frame.shape[0], dtype=np.int64)
+            df, _, original_times, _ = self._robust_reindex(frame, codes)
+            intervals = None
+            if pred_intervals:
+                intervals = [
+                    discretize_time_difference(
+                        original_times, self._min_trains[0], self._freq
+                    )
+                ]
+            return df, [df.index[0]], df.shape[0], intervals
         else:
-            all_dfs, min_trains, original_times = [], {}, OrderedDict()
-            max_train_length = 0
             g_cols = self._get_col_names(self._grouping_columns, frame.columns)
-            for grp, df in frame.groupby(g_cols, sort=False):
-                df, orig_times = self._robust_reindex(df)
-                if df.shape[0] > max_train_length:
-                    max_train_length = df.shape[0]
-                all_dfs.append(df)
-                min_trains[grp] = df.index[0]
-                original_times[grp] = orig_times
-            return pd.concat(all_dfs), min_trains, max_train_length, original_times
+            codes = frame.groupby(g_cols, sort=False).ngroup().values
+            frame, codes = frame.iloc[codes >= 0], codes[codes >= 0]
+
+            _, first_rows = np.unique(codes, return_index=True)
+            groups = list(
+                frame.iloc[first_rows][g_cols].itertuples(index=False, name=None)
+            )
+            if len(g_cols) == 1:
+                groups = [grp[0] for grp in groups]
+
+            df, codes, original_times, original_codes = self._robust_reindex(
+                frame, codes
+            )
+            starts, stops = self._get_series_bounds(codes)
+            min_trains = {grp: df.index[start] for grp, start in zip(groups, starts)}
+            max_train_length = np.max(stops - starts)
+            intervals = None
+            if pred_intervals:
+                intervals = self._get_pred_intervals(
+                    groups, original_times, original_codes
+                )
+            return df, min_trains, max_train_length, intervals
 
     def _get_cols(self, frame):
         """private util function: get indices of important columns from metadata"""
@@ -604,26 +875,21 @@ class DeepArPrimitive(
         if len(self._grouping_columns) == 0:
             self._grouping_columns = suggested_group_cols
 
-        def diff(li1, li2):
-            return list(set(li1) - set(li2))
-
-        # categorical columns
-        self._cat_columns = input_metadata.list_columns_with_semantic_types(
+        # categorical columns (in metadata order)
+        cat_columns = input_metadata.list_columns_with_semantic_types(
             ("https://metadata.datadrivendiscovery.org/types/CategoricalData",)
         )
-        self._cat_columns = diff(
-            self._cat_columns, self._grouping_columns + suggested_group_cols
-        )
+        exclude = set(self._grouping_columns + suggested_group_cols)
+        self._cat_columns = [col for col in cat_columns if col not in exclude]
 
-        # real valued columns
-        self._real_columns = input_metadata.list_columns_with_semantic_types(
+        # real valued columns (in metadata order)
+        real_columns = input_metadata.list_columns_with_semantic_types(
             ("http://schema.org/Integer", "http://schema.org/Float")
         )
-
-        self._real_columns = diff(
-            self._real_columns,
-            [self._timestamp_column] + [self._target_column] + self._grouping_columns,
+        exclude = set(
+            [self._timestamp_column] + [self._target_column] + self._grouping_columns
         )
+        self._real_columns = [col for col in real_columns if col not in exclude]
 
         # determine whether targets are count data
         self._target_semantic_types = input_metadata.query_column_field(
@@ -640,29 +906,38 @@ class DeepArPrimitive(
                 + f"choose a shorter prediction length."
             )
 
-    def _get_pred_intervals(self, original_times):
-        """private util function that retrieves unevenly spaced prediction intervals from data frame"""
+    def _get_pred_intervals(self, groups, times, codes):
+        """private util function that retrieves unevenly spaced prediction intervals of all
+        series at once, from their timestamps sorted by series code"""
 
-        if len(self._grouping_columns) == 0:
-            intervals = discretize_time_difference(
-                original_times, self._min_trains[0], self._freq, zero_index=True
+        train_codes = np.array(
+            [self._group_codes.get(grp, -1) for grp in groups], dtype=np.int64
+        )
+        for grp in [grp for grp, code in zip(groups, train_codes) if code < 0]:
+            logger.info(
+                f"Series with category {grp} did not exist in training data, "
+                + f"These predictions will be returned as np.nan."
             )
-            all_intervals = [np.array(intervals) + 1]
-        else:
-            all_intervals = []
-            for grp, times in original_times.items():
-                if grp in self._min_trains.keys():
-                    intervals = discretize_time_difference(
-                        times, self._min_trains[grp], self._freq, zero_index=True
-                    )
-                else:
-                    logger.info(
-                        f"Series with category {grp} did not exist in training data, "
-                        + f"These predictions will be returned as np.nan."
-                    )
-                    intervals = np.zeros(times.shape[0]).astype(int)
-                all_intervals.append(np.array(intervals) + 1)
-        return all_intervals
+
+        row_train_codes = train_codes[codes]
+        intervals = discretize_time_difference(
+            times,
+            self._min_trains_ns[row_train_codes].view("datetime64[ns]"),
+            self._freq,
+        )
+        intervals[row_train_codes < 0] = 1
+        starts, _ = self._get_series_bounds(codes)
+        return np.split(intervals, starts[1:])
+
+    def _index_min_trains(self):
+        """private util function: map each training series to an integer code, so that the
+        start of all training series can be looked up at once"""
+
+        if isinstance(self._min_trains, dict):
+            self._group_codes = {grp: code for code, grp in enumerate(self._min_trains)}
+            self._min_trains_ns = pd.DatetimeIndex(
+                list(self._min_trains.values())
+            ).values.astype(np.int64)
 
     def _produce(self, inputs: Inputs):
         """ internal produce method to support produce() and produce_confidence_intervals() methods """
@@ -670,7 +945,6 @@ class DeepArPrimitive(
         if not self._is_fit:
             raise PrimitiveNotFittedError("Primitive not fitted.")
 
-        test_frame = inputs.copy()
         deepar_forecast = DeepARForecast(
             self._deepar_dataset,
             self.hyperparams["weights_dir"],
@@ -678,9 +952,11 @@ class DeepArPrimitive(
             self.hyperparams["number_samples"],
             self.hyperparams["quantiles"],
             self.hyperparams["nan_padding"],
+            self._get_ctx(),
+            self.hyperparams["quantize_inference"],
+            self._predictor,
         )
-        test_frame, _, _, original_times = self._reindex(test_frame)
-        pred_intervals = self._get_pred_intervals(original_times)
+        test_frame, _, _, pred_intervals = self._reindex(inputs, pred_intervals=True)
 
         st = time.time()
         preds = deepar_forecast.predict(test_frame, pred_intervals)
@@ -3,9 +3,6 @@ from typing import List, Union
 import pandas as pd
 import numpy as np
 from sklearn.preprocessing import OrdinalEncoder
-from gluonts.dataset.common import ListDataset
-from gluonts.dataset.field_names import FieldName
-from gluonts.distribution import NegativeBinomialOutput, StudentTOutput
 
 
 class DeepARDataset:
@@ -67,6 +64,8 @@ class DeepARDataset:
         if test, creates dictionary from subset of indices using start_idx
         """
 
+        from gluonts.dataset.field_names import FieldName
+
         if not test:
             start_idx = 0
 
@@ -74,11 +73,10 @@ class DeepARDataset:
         features = {FieldName.START: feat_df.index[start_idx]}
 
         if test:
-            features[FieldName.TARGET] = targets.iloc[
-                start_idx : start_idx + self.context_length
-            ].values
-        else:
-            features[FieldName.TARGET] = targets.values
+            targets = targets.iloc[start_idx : start_idx + self.context_length]
+        features[FieldName.TARGET] = np.ascontiguousarray(
+            targets.values, dtype=np.float32
+        )
 
         if self.has_real_cols():
             if test:
@@ -92,8 +90,8 @@ class DeepARDataset:
                     )
             else:
                 real_features = feat_df.iloc[:, self.real_cols]
-            features[FieldName.FEAT_DYNAMIC_REAL] = real_features.values.reshape(
-                len(self.real_cols), -1
+            features[FieldName.FEAT_DYNAMIC_REAL] = np.ascontiguousarray(
+                real_features.values.reshape(len(self.real_cols), -1), dtype=np.float32
             )
 
         if self.has_cat_cols() or self.has_group_cols():
@@ -108,6 +106,8 @@ class DeepARDataset:
     def get_data(self):
         """ creates train dataset object """
 
+        from gluonts.dataset.common import ListDataset
+
         if self.has_group_cols():
             data = []
             g_cols = self.get_group_names()
@@ -165,6 +165,9 @@ class DeepARDataset:
 
     def get_distribution_type(self):
         """ get distribution type of dataset """
+
+        from gluonts.distribution import NegativeBinomialOutput, StudentTOutput
+
         if self.count_data:
             return NegativeBinomialOutput()
         elif self.count_data == False:
@@ -1,16 +1,17 @@
+import os
+import copy
 from pathlib import Path
 import logging
 from typing import List
 
 import numpy as np
 import pandas as pd
-from gluonts.model.predictor import GluonPredictor
-from gluonts.gluonts_tqdm import tqdm
-from gluonts.dataset.common import ListDataset
-from gluonts.core.serde import load_json
 
+from ...lazy_import import lazy_import
 from .deepar_dataset import DeepARDataset
 
+mx = lazy_import("mxnet")
+
 logger = logging.getLogger(__name__)
 # logger.setLevel(logging.DEBUG)
 
@@ -24,15 +25,29 @@ class DeepARForecast:
         num_samples: int = 100,
         quantiles: List[float] = [],
         nan_padding: bool = True,
+        ctx: "mx.Context" = None,
+        quantized: bool = False,
+        predictor: "GluonPredictor" = None,
     ):
         """constructs DeepAR forecast object
 
         if mean False, will return median point estimates
+        if quantized, will use the int8 network exported under predictor_filepath/quantized
+        if predictor None, will deserialize predictor from predictor_filepath
         """
 
+        if ctx is None:
+            ctx = mx.cpu()
         self.train_dataset = train_dataset
         self.train_frame = train_dataset.get_frame()
-        self.predictor = GluonPredictor.deserialize(Path(predictor_filepath))
+        if predictor is None:
+            from gluonts.model.predictor import GluonPredictor
+
+            predictor = GluonPredictor.deserialize(Path(predictor_filepath), ctx=ctx)
+            predictor.prediction_net.hybridize(static_alloc=True, static_shape=True)
+        self.predictor = predictor
+        if quantized:
+            self._load_quantized_net(predictor_filepath, ctx)
         self.mean = mean
         self.prediction_length = train_dataset.get_pred_length()
         self.context_length = train_dataset.get_context_length()
@@ -46,6 +61,33 @@ class DeepARForecast:
         self.pre_pad_lens = []
         self.total_in_samples = []
 
+    def _load_quantized_net(self, predictor_filepath, ctx):
+        """ replace prediction network of predictor with int8 network, if one was exported """
+
+        prefix = os.path.join(predictor_filepath, "quantized", "prediction_net")
+        if not os.path.isfile(f"{prefix}-symbol.json"):
+            logger.info("No quantized network found, using float32 inference")
+            return
+
+        try:
+            # don't swap the network of a predictor that is shared with the caller
+            self.predictor = copy.copy(self.predictor)
+            # export names the symbol's inputs data0, data1, ... in the order of
+            # input_names, so this breaks if mxnet changes its export naming
+            self.predictor.prediction_net = mx.gluon.SymbolBlock.imports(
+                f"{prefix}-symbol.json",
+                [f"data{i}" for i in range(len(self.predictor.input_names))],
+                f"{prefix}-0000.params",
+                ctx=ctx,
+            )
+            self.predictor.prediction_net.hybridize(
+                static_alloc=True, static_shape=True
+            )
+        except Exception as e:
+            logger.warning(
+                f"Failed to load quantized network, using float32 inference: {e}"
+            )
+
     def predict(self, test_frame, pred_intervals):
         """makes in-sample, out-of-sample, or both in-sample and out-of-sample
         predictions using test_frame for all timesteps included in pred_intervals
@@ -93,11 +135,21 @@ class DeepARForecast:
                     self._iterate_over_series(
                         series_idx, feat_df, targets, min_interval, max_interval
                     )
+        from gluonts.dataset.common import ListDataset
+
         self.series_idxs = np.array(self.series_idxs)
         self.data = ListDataset(self.data, freq=self.train_dataset.get_freq())
         forecasts = self._forecast()
         forecasts = self._pad(forecasts)
-        return forecasts  # Num Series, Quantiles, Horizon
+
+        # stack series into one array, padding shorter horizons with np.nan
+        horizon = max(series_forecasts.shape[1] for series_forecasts in forecasts)
+        all_forecasts = np.full(
+            (len(forecasts), len(self.quantiles) + 1, horizon), np.nan
+        )
+        for series_idx, series_forecasts in enumerate(forecasts):
+            all_forecasts[series_idx, :, : series_forecasts.shape[1]] = series_forecasts
+        return all_forecasts  # Num Series, Quantiles, Horizon
 
     def _iterate_over_series(
         self, series_idx, feat_df, targets, min_interval, max_interval
@@ -148,6 +200,8 @@ class DeepARForecast:
     def _forecast(self):
         """ make forecasts for all series contained in data """
 
+        from gluonts.gluonts_tqdm import tqdm
+
         all_forecasts = []
         with tqdm(
             self.predictor.predict(self.data, num_samples=self.num_samples),
@@ -156,9 +210,13 @@ class DeepARForecast:
         ) as forecasts, np.errstate(invalid="ignore"):
             for forecast in forecasts:
                 point_estimate = forecast.mean if self.mean else forecast.quantile(0.5)
-                quantiles = np.vstack(
-                    [point_estimate] + [forecast.quantile(q) for q in self.quantiles]
-                )
+                if len(self.quantiles) == 0:
+                    quantiles = point_estimate[np.newaxis]
+                else:
+                    quantiles = np.vstack(
+                        [point_estimate]
+                        + [forecast.quantile(q) for q in self.quantiles]
+                    )
                 all_forecasts.append(quantiles)
         return np.array(all_forecasts)  # Batch/Series, Quantiles, Prediction Length
 
@@ -8,9 +8,6 @@ from collections import OrderedDict
 
 import numpy as np
 import pandas as pd
-import mxnet as mx
-from gluonts.model.n_beats import NBEATSEnsembleEstimator
-from gluonts.trainer import Trainer
 from d3m.primitive_interfaces.base import CallResult
 from d3m.primitive_interfaces.supervised_learning import SupervisedLearnerPrimitiveBase
 from d3m import container, utils
@@ -23,7 +20,6 @@ from ..utils.time_utils import (
 )
 from .nbeats_dataset import NBEATSDataset
 from .nbeats_forecast import NBEATSForecast
-from .nbeats_predictor import NBEATSEnsembleEstimatorHook
 
 __author__ = "Distil"
 __version__ = "1.2.1"
@@ -198,7 +194,7 @@ class NBEATSPrimitive(
                 {"type": "PIP", "package": "cython", "version": "0.29.24"},
                 {
                     "type": metadata_base.PrimitiveInstallationType.PIP,
-                    "package_uri": "git+https://github.com/uncharted-distil/d3m-primitives.git@{git_commit}#egg=kf-d3m-primitives".format(
+                    "package_uri": "git+https://github.com/uncharted-distil/d3m-primitives.git@{git_commit}#egg=kf-d3m-primitives[forecasting]".format(
                         git_commit=utils.current_git_commit(os.path.dirname(__file__)),
                     ),
                 },
@@ -290,6 +286,12 @@ class NBEATSPrimitive(
         else:
             has_finished = False
 
+        # gluonts is imported when the primitive is first fit, not when it is loaded
+        from gluonts.model.n_beats import NBEATSEnsembleEstimator
+        from gluonts.trainer import Trainer
+
+        from .nbeats_predictor import NBEATSEnsembleEstimatorHook
+
         if self.hyperparams["interpretable"]:
             num_stacks = 2
             num_blocks = [1]
@@ -2,9 +2,6 @@ from typing import List, Union
 
 import pandas as pd
 import numpy as np
-from gluonts.dataset.common import ListDataset
-from gluonts.dataset.field_names import FieldName
-from gluonts.distribution import NegativeBinomialOutput, StudentTOutput
 
 
 class NBEATSDataset:
@@ -49,6 +46,8 @@ class NBEATSDataset:
         if test, creates dictionary from subset of indices using start_idx
         """
 
+        from gluonts.dataset.field_names import FieldName
+
         if not test:
             start_idx = 0
 
@@ -66,6 +65,8 @@ class NBEATSDataset:
     def get_data(self):
         """ creates train dataset object """
 
+        from gluonts.dataset.common import ListDataset
+
         if self.has_group_cols():
             data = []
             g_cols = self.get_group_names()
@@ -4,10 +4,6 @@ from typing import List
 
 import numpy as np
 import pandas as pd
-from gluonts.model.predictor import GluonPredictor
-from gluonts.gluonts_tqdm import tqdm
-from gluonts.dataset.common import ListDataset
-from gluonts.core.serde import load_json
 
 from .nbeats_dataset import NBEATSDataset
 
@@ -29,6 +25,8 @@ class NBEATSForecast:
         if mean False, will return median point estimates
         """
 
+        from gluonts.model.predictor import GluonPredictor
+
         self.train_dataset = train_dataset
         self.train_frame = train_dataset.get_frame()
         self.predictor = GluonPredictor.deserialize(Path(predictor_filepath))
@@ -87,6 +85,8 @@ class NBEATSForecast:
                     self._iterate_over_series(
                         series_idx, targets, min_interval, max_interval
                     )
+        from gluonts.dataset.common import ListDataset
+
         self.series_idxs = np.array(self.series_idxs)
         self.data = ListDataset(self.data, freq=self.train_dataset.get_freq())
         forecasts = self._forecast()
@@ -140,6 +140,8 @@ class NBEATSForecast:
     def _forecast(self):
         """ make forecasts for all series contained in data """
 
+        from gluonts.gluonts_tqdm import tqdm
+
         all_forecasts = []
         with tqdm(
             self.predictor.predict(self.data),
@@ -1,5 +1,4 @@
 import logging
-import typing
 
 import pandas as pd
 import numpy as np
@@ -99,7 +98,7 @@ def calculate_time_frequency(time_diff, model="var"):
 
 def discretize_time_difference(
     times, initial_time, frequency, integer_timestamps=False, zero_index=False
-) -> typing.Sequence[int]:
+) -> np.ndarray:
     """method that discretizes sequence of datetimes (for prediction slices)
 
     Arguments:
@@ -113,7 +112,7 @@ def discretize_time_difference(
         zero_index {bool} -- whether to subtract 1 from each index to account for 0-indexing
 
     Returns:
-        typing.Sequence[int] -- prediction intervals expressed at specific time granularity
+        np.ndarray -- prediction intervals expressed at specific time granularity
 
     """
 
@@ -124,30 +123,31 @@ def discretize_time_difference(
     if integer_timestamps:
         time_differences = time_differences.values.astype(int)
         if zero_index:
-            time_differences = [diff - 1 for diff in time_differences]
+            time_differences = time_differences - 1
         return time_differences
 
-    # convert to seconds representation
+    # convert to seconds representation (microsecond resolution, like total_seconds)
     if type(time_differences.iloc[0]) is pd._libs.tslibs.timedeltas.Timedelta:
-        time_differences = time_differences.apply(lambda t: t.total_seconds())
+        time_differences = (
+            pd.to_timedelta(time_differences).values.astype(np.int64) // 1000 / 1e6
+        )
+    time_differences = np.asarray(time_differences, dtype=np.float64)
 
     if frequency == "YS" or frequency == "12M":
-        time_differences = [round(x / S_PER_YEAR) for x in time_differences]
+        seconds_per_step = S_PER_YEAR
     elif frequency == "MS" or frequency == "M":
-        time_differences = [round(x / S_PER_MONTH) for x in time_differences]
-        #     round(x / ((1/12 * S_PER_MONTH_28) * (1/3 * S_PER_MONTH_30) + ( * S_PER_MONTH_31)))
-        #     for x in time_differences
-        # ]
+        seconds_per_step = S_PER_MONTH
     elif frequency == "W" or frequency == "W-MON":
-        time_differences = [round(x / S_PER_WEEK) for x in time_differences]
+        seconds_per_step = S_PER_WEEK
     elif frequency == "D":
-        time_differences = [round(x / S_PER_DAY) for x in time_differences]
+        seconds_per_step = S_PER_DAY
     elif frequency == "H":
-        time_differences = [round(x / S_PER_HR) for x in time_differences]
+        seconds_per_step = S_PER_HR
     else:
-        time_differences = [round(x / SECONDS_PER_MINUTE) for x in time_differences]
+        seconds_per_step = SECONDS_PER_MINUTE
+    time_differences = np.round(time_differences / seconds_per_step).astype(np.int64)
 
     if zero_index:
-        time_differences = [diff - 1 for diff in time_differences]
+        time_differences -= 1
 
     return time_differences
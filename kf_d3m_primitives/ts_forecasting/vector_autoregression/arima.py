@@ -1,6 +1,5 @@
 import logging
 
-from pmdarima.arima import auto_arima
 import pandas as pd
 import numpy as np
 
@@ -41,6 +40,8 @@ class Arima:
             np array -- endogenous time series on which model should select parameters and fit
         """
 
+        from pmdarima.arima import auto_arima
+
         self.min_train = min(train)
 
         if self.log_transform:
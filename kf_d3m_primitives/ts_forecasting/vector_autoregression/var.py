@@ -14,13 +14,11 @@ from d3m.exceptions import PrimitiveNotFittedError
 from d3m import container, utils
 from d3m.container import DataFrame as d3m_DataFrame
 from d3m.metadata import hyperparams, base as metadata_base, params
-from statsmodels.tsa.api import VAR as vector_ar
-from statsmodels.tsa.vector_ar.var_model import VARResultsWrapper
-import statsmodels.api as sm
 import scipy.stats as stats
 
 from ..utils.time_utils import calculate_time_frequency, discretize_time_difference
 from .arima import Arima
+from .vector_ar import VectorAR
 
 logger = logging.getLogger(__name__)
 # logger.setLevel(logging.DEBUG)
@@ -48,9 +46,7 @@ class Params(params.Params):
     freq: str
     is_fit: bool
 
-    fits: Union[
-        List[VARResultsWrapper], List[Arima], List[Union[VARResultsWrapper, Arima]]
-    ]
+    fits: Union[List[VectorAR], List[Arima], List[Union[VectorAR, Arima]]]
     values: List[np.ndarray]
     values_diff: List[np.ndarray]
     lag_order: Union[
@@ -149,7 +145,7 @@ class VarPrimitive(
     """
     This primitive applies a vector autoregression (VAR) multivariate forecasting model to time series data.
     It defaults to an ARIMA model if the time series is univariate. The VAR
-    implementation comes from the statsmodels library. The lag order and AR, MA, and
+    model is a least squares fit that follows the statsmodels implementation. The lag order and AR, MA, and
     differencing terms for the VAR and ARIMA models respectively are selected automatically
     and independently for each regression. User can override automatic selection with 'max_lag_order' HP.
     """
@@ -171,7 +167,7 @@ class VarPrimitive(
                 {"type": "PIP", "package": "cython", "version": "0.29.24"},
                 {
                     "type": metadata_base.PrimitiveInstallationType.PIP,
-                    "package_uri": "git+https://github.com/uncharted-distil/d3m-primitives.git@{git_commit}#egg=kf-d3m-primitives".format(
+                    "package_uri": "git+https://github.com/uncharted-distil/d3m-primitives.git@{git_commit}#egg=kf-d3m-primitives[forecasting]".format(
                         git_commit=utils.current_git_commit(os.path.dirname(__file__)),
                     ),
                 },
@@ -311,7 +307,7 @@ class VarPrimitive(
             arima_max_order = self.hyperparams["max_lag_order"]
 
         self.models = [
-            vector_ar(vals, dates=original.index, freq=self._freq)
+            VectorAR(vals)
             if vals.shape[1] > 1
             else Arima(
                 seasonal=self.hyperparams["seasonal"],
@@ -319,7 +315,7 @@ class VarPrimitive(
                 max_order=arima_max_order,
                 dynamic=self.hyperparams["dynamic"],
             )
-            for vals, original in zip(self._values_diff, self._X_train)
+            for vals in self._values_diff
         ]
 
         self._robust_fit(self.models, self._values_diff, self._X_train)
@@ -663,9 +659,7 @@ class VarPrimitive(
             # VAR
             if vals.shape[1] > 1:
                 try:
-                    lags = model.select_order(
-                        maxlags=self.hyperparams["max_lag_order"]
-                    ).bic
+                    lags = model.select_order(maxlags=self.hyperparams["max_lag_order"])
                     logger.info(
                         "Successfully performed model order selection. Optimal order = {} lags".format(
                             lags
@@ -678,7 +672,7 @@ class VarPrimitive(
                     lags = 0
                     logger.info("ValueError: " + str(e) + ". Using lag order of 0")
                 self._lag_order.append(lags)
-                self._fits.append(model.fit(maxlags=lags))
+                self._fits.append(model.fit(lags))
 
             # ARIMA
             else:
@@ -780,7 +774,7 @@ class VarPrimitive(
                         )
                     elif lags == 0:
                         q = stats.norm.ppf(1 - alpha / 2)
-                        sigma = np.sqrt(fit._forecast_vars(horizon))
+                        sigma = np.sqrt(fit.forecast_vars(horizon))
                         mean = np.repeat(fit.params, horizon, axis=0)
                         lower = np.repeat(fit.params - q * sigma, horizon, axis=0)
                         upper = np.repeat(fit.params + q * sigma, horizon, axis=0)
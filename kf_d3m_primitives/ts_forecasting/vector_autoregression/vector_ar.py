@@ -0,0 +1,187 @@
+import logging
+
+import numpy as np
+import scipy.stats as stats
+
+logger = logging.getLogger(__name__)
+
+
+class VectorAR:
+    def __init__(self, endog):
+        """initialize vector autoregression (constant trend) class. follows statsmodels'
+        VAR estimator: least squares fit of each equation, lag order selected by BIC
+
+        Arguments:
+            endog {np array} -- (n_obs, n_series) endogenous time series
+        """
+
+        self.endog = np.asarray(endog, dtype=np.float64)
+        self.n_obs, self.n_series = self.endog.shape
+
+    def select_order(self, maxlags=None):
+        """select lag order that minimizes BIC. each lag order is estimated on the same
+        number of observations
+
+        Keyword Arguments:
+            maxlags {int} -- maximum lag order to consider, if None chosen from the number of
+                observations (default: {None})
+
+        Raises:
+            ValueError: if maxlags is too large to estimate for the number of observations
+
+        Returns:
+            int -- selected lag order
+        """
+
+        max_estimable = (self.n_obs - self.n_series - 1) // (1 + self.n_series)
+        if maxlags is None:
+            maxlags = min(
+                int(round(12 * (self.n_obs / 100.0) ** (1 / 4.0))), max_estimable
+            )
+        if maxlags > max_estimable or maxlags < 0:
+            raise ValueError(
+                "maxlags is too large for the number of observations and the number of "
+                + "equations. The largest model cannot be estimated."
+            )
+
+        bics = [
+            self._bic(*self._estimate(self.endog[maxlags - lags :], lags))
+            for lags in range(maxlags + 1)
+        ]
+        return int(np.argmin(bics))
+
+    def fit(self, lags):
+        """fit VAR model with given lag order on all observations
+
+        Arguments:
+            lags {int} -- lag order
+
+        Returns:
+            VectorAR -- fit model
+        """
+
+        self.params, resid, z = self._estimate(self.endog, lags)
+        self.k_ar = lags
+        self.nobs = z.shape[0]
+        self.df_resid = self.nobs - (self.n_series * lags + 1)
+        self.sigma_u = resid.T @ resid / self.df_resid
+        self.fittedvalues = z @ self.params
+        return self
+
+    @property
+    def coefs(self):
+        """ (k_ar, n_series, n_series) coefficients, coefs[i] applies to lag i + 1 """
+        return (
+            self.params[1:]
+            .reshape((self.k_ar, self.n_series, self.n_series))
+            .swapaxes(1, 2)
+        )
+
+    def forecast(self, y, steps):
+        """iterated forecast steps into the future
+
+        Arguments:
+            y {np array} -- (k_ar, n_series) most recent observations
+            steps {int} -- number of periods to forecast into the future
+
+        Returns:
+            np array -- (steps, n_series) forecasts
+        """
+
+        coefs = self.coefs
+        history = list(np.asarray(y, dtype=np.float64)[len(y) - self.k_ar :])
+        forecasts = np.empty((steps, self.n_series))
+        for h in range(steps):
+            forecasts[h] = self.params[0] + sum(
+                coef @ prior for coef, prior in zip(coefs, reversed(history))
+            )
+            history.append(forecasts[h])
+        return forecasts
+
+    def forecast_vars(self, steps):
+        """forecast error variance of each series, from the moving average representation
+
+        Arguments:
+            steps {int} -- number of periods to forecast into the future
+
+        Returns:
+            np array -- (steps, n_series) forecast variances
+        """
+
+        coefs = self.coefs
+        phis = [np.eye(self.n_series)]
+        for i in range(1, steps):
+            phis.append(
+                sum(
+                    (
+                        phis[i - j] @ coefs[j - 1]
+                        for j in range(1, min(i, self.k_ar) + 1)
+                    ),
+                    np.zeros((self.n_series, self.n_series)),
+                )
+            )
+        variances = np.cumsum([phi @ self.sigma_u @ phi.T for phi in phis], axis=0)
+        return np.diagonal(variances, axis1=1, axis2=2)
+
+    def forecast_interval(self, y, steps, alpha=0.05):
+        """iterated forecast steps into the future with confidence interval
+
+        Arguments:
+            y {np array} -- (k_ar, n_series) most recent observations
+            steps {int} -- number of periods to forecast into the future
+
+        Keyword Arguments:
+            alpha {float} -- significance level for confidence interval, i.e. alpha = 0.05
+                returns a 95% confdience interval from alpha / 2 to 1 - (alpha / 2)
+                (default: {0.05})
+
+        Returns:
+            tuple(np array) -- (steps, n_series) forecasts, lower bounds and upper bounds
+        """
+
+        mean = self.forecast(y, steps)
+        q = stats.norm.ppf(1 - alpha / 2)
+        sigma = np.sqrt(self.forecast_vars(steps))
+        return mean, mean - q * sigma, mean + q * sigma
+
+    def _estimate(self, endog, lags):
+        """least squares estimate of VAR(lags) with constant on endog
+
+        Raises:
+            ValueError: if a lagged series is a non-zero constant (collinear with the trend)
+
+        Returns:
+            tuple(np array) -- (1 + n_series * lags, n_series) params, residuals,
+                and lagged design matrix
+        """
+
+        n_obs = endog.shape[0]
+        # [1, y_t-1, ..., y_t-lags] for t in lags..n_obs - 1
+        lagged = [endog[lags - i : n_obs - i] for i in range(1, lags + 1)]
+        if lags > 0:
+            lagged_values = np.concatenate(lagged, axis=1)
+            constant_cols = (np.ptp(lagged_values, axis=0) == 0) & (
+                lagged_values[0] != 0
+            )
+            if constant_cols.any():
+                raise ValueError(
+                    "x contains a constant. Adding a constant with trend='c' is not allowed."
+                )
+        z = np.concatenate([np.ones((n_obs - lags, 1))] + lagged, axis=1)
+        y = endog[lags:]
+        params = np.linalg.lstsq(z, y, rcond=1e-15)[0]
+        return params, y - z @ params, z
+
+    def _bic(self, params, resid, z):
+        """ Bayesian information criterion of an estimate (Lütkepohl pp. 146-150) """
+
+        nobs = z.shape[0]
+        lags = (z.shape[1] - 1) // self.n_series
+        free_params = lags * self.n_series ** 2 + self.n_series
+        if nobs - z.shape[1]:
+            # raises LinAlgError if residual covariance is not positive definite
+            chol = np.linalg.cholesky(resid.T @ resid / nobs)
+            logdet = 2 * np.sum(np.log(np.diagonal(chol)))
+        else:
+            logdet = -np.inf
+        return logdet + (np.log(nobs) / nobs) * free_params
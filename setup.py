@@ -1,44 +1,81 @@
 from setuptools import setup, find_packages
 
+# tensorflow 2.2 is pinned on the python versions the D3M evaluation image uses, newer
+# pythons (which 2.2 has no wheels for) get a release with gpu support built in. 2.11
+# dropped the optimizers' lr argument that keras-retinanet and its keras 2 calls rely on
+tensorflow_cpu = [
+    "tensorflow==2.2.0; python_version<'3.8'",
+    "tensorflow>=2.8,<2.11; python_version>='3.8'",
+]
+# tensorflow-gpu 2.2 only has linux wheels, other platforms fall back to the cpu build
+tensorflow_gpu = [
+    "tensorflow-gpu==2.2.0; python_version<'3.8' and sys_platform=='linux'",
+    "tensorflow==2.2.0; python_version<'3.8' and sys_platform!='linux'",
+    "tensorflow>=2.8,<2.11; python_version>='3.8'",
+]
+
+extras_require = {
+    "cpu": tensorflow_cpu + ["mxnet==1.6.0"],
+    "gpu-cuda-10.1": tensorflow_gpu + ["mxnet-cu101mkl==1.6.0.post0"],
+    "gpu-cuda-9.2": tensorflow_gpu + ["mxnet-cu92mkl==1.6.0.post0"],
+    "clustering": ["tslearn==0.4.1"],
+    "forecasting": [
+        "gluonts>=0.6.0,<0.7.0",
+        "pmdarima>=1.6.1",
+    ],
+    "explainability": ["shap==0.37.0"],
+    "torch": [
+        "torch>=1.4.0",
+        "torchvision>=0.5.0",
+        "opencv-python-headless==4.1.1.26",
+        "segmentation-models-pytorch==0.1.3",
+        "lz4==3.1.3",
+        "rsp @ git+https://github.com/cfld/rs_pretrained@92d832efe1961d6a06011f689dad7ef2481a64b1#egg=rsp",
+    ],
+    "vision": [
+        "object_detection_retinanet @ git+https://github.com/uncharted-distil/object-detection-retinanet@4cf8c85c03527194e7ea305d842d4621610c6a3c#egg=object_detection_retinanet",
+    ],
+    "nlp": [
+        "Simon @ git+https://github.com/uncharted-distil/simon@e4b324d387a6bc8318c02c2c57d340b466578744#egg=Simon",
+        "nk_sent2vec @ git+https://github.com/uncharted-distil/nk-sent2vec@636ece7c12692b0a2b36161f934b0e6fd15a7f6a#egg=nk_sent2vec",
+        "duke @ git+https://github.com/uncharted-distil/duke@627912e23685d058c6becc4e4615a7d3e8c93b93#egg=duke",
+    ],
+    "onnx": ["tf2onnx>=1.8.0", "onnxruntime>=1.6.0"],
+}
+# all primitive dependencies, tensorflow and mxnet still come from one of the build extras
+extras_require["all"] = [
+    req
+    for extra in (
+        "clustering",
+        "forecasting",
+        "explainability",
+        "torch",
+        "vision",
+        "nlp",
+    )
+    for req in extras_require[extra]
+]
+
 setup(
     name="kf-d3m-primitives",
     version="0.7.0",
     description="All Kung Fu D3M primitives as a single library",
     license="Apache-2.0",
-    packages=find_packages(exclude="scripts"),
+    packages=find_packages(include=["kf_d3m_primitives", "kf_d3m_primitives.*"]),
     setkeywords=["d3m_primitive"],
     install_requires=[
         "d3m",
-        "torch>=1.4.0",
         "pillow==7.1.2",
-        "tslearn==0.4.1",
-        "statsmodels==0.11.1",
-        "pmdarima>=1.6.1",
         "hdbscan==0.8.26",
         "requests>=2.23.0",
-        "shap==0.37.0",
-        "torchvision>=0.5.0",
-        "opencv-python-headless==4.1.1.26",
-        "gluonts>=0.6.0,<0.7.0",
-        "albumentations==0.4.6",
-        "tifffile==2020.8.13",
         "tqdm==4.48.2",
-        "segmentation-models-pytorch==0.1.3",
-        "lz4==3.1.3",
         "faiss-cpu==1.7.0",
+        "numba>=0.48.0",
         "punk @ git+https://github.com/uncharted-distil/punk@8b101eca26b5f9a3df2a65aab2733bd404965578#egg=punk",
-        "object_detection_retinanet @ git+https://github.com/uncharted-distil/object-detection-retinanet@4cf8c85c03527194e7ea305d842d4621610c6a3c#egg=object_detection_retinanet",
-        "Simon @ git+https://github.com/uncharted-distil/simon@e4b324d387a6bc8318c02c2c57d340b466578744#egg=Simon",
-        "nk_sent2vec @ git+https://github.com/uncharted-distil/nk-sent2vec@636ece7c12692b0a2b36161f934b0e6fd15a7f6a#egg=nk_sent2vec",
-        "duke @ git+https://github.com/uncharted-distil/duke@627912e23685d058c6becc4e4615a7d3e8c93b93#egg=duke",
-        "rsp @ git+https://github.com/cfld/rs_pretrained@92d832efe1961d6a06011f689dad7ef2481a64b1#egg=rsp",
     ],
-    extras_require={
-        "cpu": ["tensorflow==2.2.0", "mxnet==1.6.0"],
-        "gpu-cuda-10.1": ["tensorflow-gpu==2.2.0", "mxnet-cu101mkl==1.6.0.post0"],
-        "gpu-cuda-9.2": ["tensorflow-gpu==2.2.0", "mxnet-cu92mkl==1.6.0.post0"],
-    },
+    extras_require=extras_require,
     entry_points={
+        "console_scripts": ["kf-d3m = kf_d3m_primitives._cli:main"],
         "d3m.primitives": [
             "data_cleaning.column_type_profiler.Simon = kf_d3m_primitives.data_preprocessing.data_typing.simon:SimonPrimitive",
             "data_cleaning.geocoding.Goat_forward = kf_d3m_primitives.data_preprocessing.geocoding_forward.goat_forward:GoatForwardPrimitive",
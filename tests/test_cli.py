@@ -0,0 +1,67 @@
+import sys
+
+import pytest
+
+from kf_d3m_primitives import _cli, _entry_cache
+
+TARGETS = [
+    (
+        "time_series_forecasting.lstm.DeepAR",
+        "kf_d3m_primitives.ts_forecasting.deep_ar.deepar:DeepArPrimitive",
+    ),
+    (
+        "time_series_forecasting.vector_autoregression.VAR",
+        "kf_d3m_primitives.ts_forecasting.vector_autoregression.var:VarPrimitive",
+    ),
+    (
+        "clustering.hdbscan.Hdbscan",
+        "kf_d3m_primitives.clustering.hdbscan.Hdbscan:HdbscanPrimitive",
+    ),
+]
+
+
+@pytest.fixture
+def installed(tmp_path, monkeypatch):
+    """ registers TARGETS as this package's entry points, with none of them imported """
+
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    entry_points_file = tmp_path / "entry_points.txt"
+    entry_points_file.write_text("[d3m.primitives]\n")
+    monkeypatch.setattr(
+        _entry_cache,
+        "_distribution",
+        lambda: ("1.0.0", str(entry_points_file), list(TARGETS)),
+    )
+    for _, target in TARGETS:
+        monkeypatch.delitem(sys.modules, target.split(":")[0], raising=False)
+
+
+def test_list_primitives_imports_nothing(installed, capsys):
+    assert _cli.main(["--list-primitives"]) == 0
+
+    lines = capsys.readouterr().out.splitlines()
+    assert lines == sorted(
+        f"d3m.primitives.{name}\t{target}" for name, target in TARGETS
+    )
+    for _, target in TARGETS:
+        assert target.split(":")[0] not in sys.modules
+
+
+def test_version(installed, capsys):
+    assert _cli.main(["--version"]) == 0
+    assert capsys.readouterr().out == "1.0.0\n"
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [["--version"], ["--list-primitives"], ["--inspect", "clustering.hdbscan.Hdbscan"]],
+)
+def test_not_installed(argv, tmp_path, monkeypatch, capsys):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.setattr(_entry_cache, "DISTRIBUTION", "kf-d3m-primitives-missing")
+
+    with pytest.raises(SystemExit) as e:
+        _cli.main(argv)
+
+    assert e.value.code == 2
+    assert "kf-d3m-primitives-missing is not installed" in capsys.readouterr().err
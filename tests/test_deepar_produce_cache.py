@@ -0,0 +1,62 @@
+import numpy as np
+from d3m import container
+
+from kf_d3m_primitives.ts_forecasting.deep_ar.deepar import DeepArPrimitive, Hyperparams
+
+
+def _primitive(monkeypatch):
+    """primitive whose _produce predicts the row count of its inputs (+ one per fit) for
+    one series, one quantile and two horizons"""
+
+    primitive = DeepArPrimitive(hyperparams=Hyperparams.defaults())
+    primitive._output_column = "value"
+    primitive._is_fit = True
+    primitive.n_fits = 0
+    calls = []
+
+    def _produce(inputs):
+        calls.append(inputs)
+        preds = np.full((1, 1, 2), float(inputs.shape[0] + primitive.n_fits))
+        return preds, [np.array([0, 1])]
+
+    monkeypatch.setattr(primitive, "_produce", _produce)
+    return primitive, calls
+
+
+def _inputs(n_rows):
+    return container.DataFrame({"a": range(n_rows)}, generate_metadata=True)
+
+
+def test_preds_reused_for_same_inputs(monkeypatch):
+    primitive, calls = _primitive(monkeypatch)
+    inputs = _inputs(2)
+
+    primitive.produce(inputs=inputs)
+    intervals = primitive.produce_confidence_intervals(inputs=inputs).value
+
+    assert len(calls) == 1
+    assert list(intervals.iloc[:, 0]) == [2, 2]
+
+
+def test_preds_follow_inputs(monkeypatch):
+    primitive, calls = _primitive(monkeypatch)
+
+    first = primitive.produce(inputs=_inputs(2)).value
+    second = primitive.produce(inputs=_inputs(3)).value
+
+    assert len(calls) == 2
+    assert list(first["value"]) == [2, 2]
+    assert list(second["value"]) == [3, 3]
+
+
+def test_preds_dropped_on_refit(monkeypatch):
+    primitive, calls = _primitive(monkeypatch)
+    inputs = _inputs(2)
+    primitive.produce(inputs=inputs)
+
+    # what fit and set_params do once the model changes
+    primitive.n_fits += 1
+    primitive._reset_preds()
+
+    assert list(primitive.produce(inputs=inputs).value["value"]) == [3, 3]
+    assert len(calls) == 2
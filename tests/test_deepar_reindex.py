@@ -0,0 +1,264 @@
+import numpy as np
+import pandas as pd
+import pytest
+from d3m import container
+from d3m.metadata import base as metadata_base
+
+from kf_d3m_primitives.ts_forecasting.deep_ar.deepar import DeepArPrimitive, Hyperparams
+
+DAY = 86400
+SEMANTIC_TYPES = {
+    "grp": "https://metadata.datadrivendiscovery.org/types/GroupingKey",
+    "ts": "https://metadata.datadrivendiscovery.org/types/Time",
+    "real": "http://schema.org/Float",
+    "cat": "https://metadata.datadrivendiscovery.org/types/CategoricalData",
+    "target": "https://metadata.datadrivendiscovery.org/types/TrueTarget",
+}
+
+
+def _frame(rows, grouped=True, integer_times=False):
+    """ d3m frame of (grp, ts, real, cat, target) rows, ts in seconds (or day indices) """
+
+    columns = ["grp", "ts", "real", "cat", "target"]
+    if not grouped:
+        columns = columns[1:]
+        rows = [row[1:] for row in rows]
+    frame = container.DataFrame(
+        pd.DataFrame(rows, columns=columns), generate_metadata=True
+    )
+    for i, col in enumerate(columns):
+        frame.metadata = frame.metadata.add_semantic_type(
+            (metadata_base.ALL_ELEMENTS, i), SEMANTIC_TYPES[col]
+        )
+    if integer_times:
+        frame.metadata = frame.metadata.add_semantic_type(
+            (metadata_base.ALL_ELEMENTS, columns.index("ts")),
+            "http://schema.org/Integer",
+        )
+    return frame
+
+
+def _primitive(frame):
+    primitive = DeepArPrimitive(hyperparams=Hyperparams.defaults())
+    primitive._get_cols(frame)
+    primitive._set_freq(frame)
+    return primitive
+
+
+def _days(*days):
+    return [pd.Timestamp(day * DAY, unit="s") for day in days]
+
+
+def test_reindex_fills_gaps():
+    frame = _frame(
+        [
+            ("a", 0 * DAY, 1.0, "x", 10.0),
+            ("a", 1 * DAY, 2.0, "x", 11.0),
+            ("a", 4 * DAY, 5.0, "y", 14.0),
+            ("b", 2 * DAY, 0.0, "z", 20.0),
+            ("b", 3 * DAY, 1.0, "z", 21.0),
+        ]
+    )
+    primitive = _primitive(frame)
+    assert primitive._freq == "D"
+
+    df, min_trains, max_train_length, intervals = primitive._reindex(frame)
+
+    assert list(df.index) == _days(0, 1, 2, 3, 4, 2, 3)
+    assert min_trains == {"a": pd.Timestamp(0), "b": pd.Timestamp(2 * DAY, unit="s")}
+    assert max_train_length == 5
+    assert intervals is None
+    np.testing.assert_allclose(df["real"].values, [1, 2, 3, 4, 5, 0, 1])
+    np.testing.assert_allclose(
+        df["target"].values, [10, 11, np.nan, np.nan, 14, 20, 21]
+    )
+    assert list(df["cat"]) == ["x", "x", "x", "x", "y", "z", "z"]
+    assert list(df["grp"]) == ["a"] * 5 + ["b"] * 2
+
+
+def test_reindex_sorts_unordered_rows():
+    frame = _frame(
+        [
+            ("b", 1 * DAY, 1.0, "z", 21.0),
+            ("a", 1 * DAY, 2.0, "x", 11.0),
+            ("b", 0 * DAY, 0.0, "z", 20.0),
+            ("a", 0 * DAY, 1.0, "x", 10.0),
+        ]
+    )
+    df, min_trains, _, _ = _primitive(frame)._reindex(frame)
+
+    # series keep the order their groups first appear in
+    assert list(min_trains) == ["b", "a"]
+    assert list(df["grp"]) == ["b", "b", "a", "a"]
+    assert list(df.index) == _days(0, 1, 0, 1)
+    np.testing.assert_allclose(df["target"].values, [20, 21, 10, 11])
+
+
+def test_reindex_drops_duplicate_timestamps():
+    frame = _frame(
+        [
+            ("a", 0 * DAY, 1.0, "x", 10.0),
+            ("a", 1 * DAY, 2.0, "x", 11.0),
+            ("a", 1 * DAY, 9.0, "y", 99.0),
+            ("a", 3 * DAY, 4.0, "x", 13.0),
+            ("b", 1 * DAY, 0.0, "z", 20.0),
+        ]
+    )
+    primitive = _primitive(frame)
+    df, _, max_train_length, _ = primitive._reindex(frame)
+
+    # the first row of each duplicated timestamp is kept
+    assert list(df.index) == _days(0, 1, 2, 3, 1)
+    assert max_train_length == 4
+    np.testing.assert_allclose(df["real"].values, [1, 2, 3, 4, 0])
+    np.testing.assert_allclose(df["target"].values, [10, 11, np.nan, 13, 20])
+
+    sorted_frame, codes = primitive._sort_by_timestamp(frame, np.array([0, 0, 0, 0, 1]))
+    _, _, original_times, original_codes = primitive._robust_reindex(
+        frame, np.array([0, 0, 0, 0, 1])
+    )
+    assert list(codes) == list(original_codes) == [0, 0, 0, 0, 1]
+    assert list(original_times) == _days(0, 1, 1, 3, 1)
+    np.testing.assert_allclose(sorted_frame["target"].values, [10, 11, 99, 13, 20])
+
+
+def test_reindex_leading_and_trailing_nan():
+    frame = _frame(
+        [
+            ("a", 0 * DAY, np.nan, "x", 10.0),
+            ("a", 1 * DAY, np.nan, "x", 11.0),
+            ("a", 2 * DAY, 2.0, "x", 12.0),
+            ("a", 4 * DAY, 6.0, "x", 14.0),
+            ("a", 5 * DAY, np.nan, "x", 15.0),
+            ("b", 0 * DAY, 3.0, "z", 20.0),
+            ("b", 1 * DAY, np.nan, "z", 21.0),
+        ]
+    )
+    df, _, _, _ = _primitive(frame)._reindex(frame)
+
+    # leading NA values are kept, trailing NA values take the last valid value
+    np.testing.assert_allclose(df["real"].values, [np.nan, np.nan, 2, 4, 6, 6, 3, 3])
+
+
+def test_interpolate_does_not_cross_series():
+    primitive = DeepArPrimitive(hyperparams=Hyperparams.defaults())
+    values = np.array(
+        [[1.0, np.nan], [np.nan, 2.0], [3.0, np.nan], [np.nan, 4.0], [5.0, 6.0]]
+    )
+    codes = np.array([0, 0, 0, 1, 1])
+
+    interpolated = primitive._interpolate(values, codes)
+
+    np.testing.assert_allclose(
+        interpolated, [[1, np.nan], [2, 2], [3, 2], [np.nan, 4], [5, 6]]
+    )
+
+
+def test_reindex_integer_timestamps():
+    frame = _frame(
+        [("a", 1, 1.0, "x", 10.0), ("a", 3, 3.0, "x", 12.0)],
+        grouped=False,
+        integer_times=True,
+    )
+    primitive = _primitive(frame)
+    df, min_trains, max_train_length, _ = primitive._reindex(frame)
+
+    # integer timestamps are day indices starting at 1
+    assert primitive._freq == "D"
+    assert list(df.index) == _days(0, 1, 2)
+    assert min_trains == [pd.Timestamp(0)]
+    assert max_train_length == 3
+    np.testing.assert_allclose(df["real"].values, [1, 2, 3])
+
+
+@pytest.mark.parametrize(
+    "reind_freq, times",
+    [
+        (
+            "MS",
+            pd.DatetimeIndex(["2020-01-01", "2020-02-01", "2020-05-01", "2020-06-01"]),
+        ),
+        ("W-MON", pd.DatetimeIndex(["2020-01-06", "2020-01-20", "2020-02-03"])),
+        (
+            "H",
+            pd.DatetimeIndex(
+                ["2020-01-01 00:00", "2020-01-01 01:00", "2020-01-01 05:00"]
+            ),
+        ),
+    ],
+)
+def test_get_reindex_times_calendar_frequencies(reind_freq, times):
+    primitive = DeepArPrimitive(hyperparams=Hyperparams.defaults())
+    primitive._reind_offset = pd.tseries.frequencies.to_offset(reind_freq)
+    single = pd.DatetimeIndex([pd.Timestamp("2021-03-01")])
+    all_times = times.append(single).values
+
+    new_times, lengths = primitive._get_reindex_times(
+        all_times, np.array([0, len(times)]), np.array([len(times), len(times) + 1])
+    )
+
+    expected = pd.date_range(times[0], times[-1], freq=reind_freq)
+    assert list(lengths) == [len(expected), 1]
+    assert list(new_times) == list(expected) + list(single)
+
+
+def test_reindex_monthly_frequency():
+    months = pd.DatetimeIndex(["2020-01-01", "2020-02-01", "2020-04-01"])
+    seconds = months.values.astype(np.int64) // 10 ** 9
+    frame = _frame(
+        [("a", float(s), float(i), "x", float(i)) for i, s in enumerate(seconds)],
+        grouped=False,
+    )
+    primitive = _primitive(frame)
+    df, _, max_train_length, _ = primitive._reindex(frame)
+
+    assert primitive._reind_freq == "MS"
+    assert list(df.index) == list(pd.date_range("2020-01-01", "2020-04-01", freq="MS"))
+    assert max_train_length == 4
+    np.testing.assert_allclose(df["real"].values, [0, 1, 1.5, 2])
+
+
+def test_pred_intervals_unseen_group():
+    train = _frame(
+        [
+            ("a", 0 * DAY, 1.0, "x", 10.0),
+            ("a", 1 * DAY, 2.0, "x", 11.0),
+            ("b", 2 * DAY, 0.0, "z", 20.0),
+            ("b", 3 * DAY, 1.0, "z", 21.0),
+        ]
+    )
+    primitive = _primitive(train)
+    _, primitive._min_trains, _, _ = primitive._reindex(train)
+    primitive._index_min_trains()
+
+    test = _frame(
+        [
+            ("c", 5 * DAY, 0.0, "z", np.nan),
+            ("b", 6 * DAY, 1.0, "z", np.nan),
+            ("a", 4 * DAY, 1.0, "x", np.nan),
+            ("b", 4 * DAY, 1.0, "z", np.nan),
+            ("c", 6 * DAY, 0.0, "z", np.nan),
+        ]
+    )
+    _, _, _, intervals = primitive._reindex(test, pred_intervals=True)
+
+    # series are in order of first appearance, unseen groups predict at interval 1
+    assert [list(series) for series in intervals] == [[1, 1], [2, 4], [4]]
+
+
+def test_pred_intervals_ungrouped():
+    train = _frame(
+        [("a", 0 * DAY, 1.0, "x", 10.0), ("a", 1 * DAY, 2.0, "x", 11.0)],
+        grouped=False,
+    )
+    primitive = _primitive(train)
+    _, primitive._min_trains, _, _ = primitive._reindex(train)
+    primitive._index_min_trains()
+
+    test = _frame(
+        [("a", 3 * DAY, 1.0, "x", np.nan), ("a", 2 * DAY, 1.0, "x", np.nan)],
+        grouped=False,
+    )
+    _, _, _, intervals = primitive._reindex(test, pred_intervals=True)
+
+    assert [list(series) for series in intervals] == [[2, 3]]
@@ -0,0 +1,147 @@
+import os
+import sys
+
+import pytest
+
+from kf_d3m_primitives import _entry_cache
+
+FAKE_MODULES = ("fake_prims_one", "fake_prims_two", "fake_pkg", "fake_pkg.util")
+
+
+@pytest.fixture
+def fake_install(tmp_path, monkeypatch):
+    """ installs a fake distribution whose entry points target modules in tmp_path """
+
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.syspath_prepend(str(tmp_path))
+    install = {
+        "entry_points_file": str(tmp_path / "entry_points.txt"),
+        "targets": [("clustering.fake.One", "fake_prims_one:One")],
+    }
+    _write_entry_points(install)
+
+    def _distribution():
+        return "1.0.0", install["entry_points_file"], list(install["targets"])
+
+    monkeypatch.setattr(_entry_cache, "_distribution", _distribution)
+    (tmp_path / "fake_prims_one.py").write_text("class One:\n    pass\n")
+    (tmp_path / "fake_prims_two.py").write_text("class Two:\n    pass\n")
+    (tmp_path / "fake_pkg").mkdir()
+    (tmp_path / "fake_pkg" / "__init__.py").write_text("")
+    (tmp_path / "fake_pkg" / "util.py").write_text("VALUE = 3\n")
+    (tmp_path / "fake_pkg" / "prims.py").write_text(
+        "from .util import VALUE\n\n\nclass Three:\n    value = VALUE\n"
+    )
+    yield install
+    for module in FAKE_MODULES + ("fake_pkg.prims",):
+        sys.modules.pop(module, None)
+
+
+def _write_entry_points(install):
+    """ rewrites entry_points.txt with a later mtime, like reinstalling the package """
+
+    path = install["entry_points_file"]
+    mtime = os.path.getmtime(path) + 10 if os.path.exists(path) else 1000000
+    with open(path, "w") as f:
+        f.write("[d3m.primitives]\n")
+        for name, target in install["targets"]:
+            f.write(f"{name} = {target}\n")
+    os.utime(path, (mtime, mtime))
+
+
+def test_build_index(fake_install, tmp_path):
+    index = _entry_cache.load_index()
+
+    assert index == {
+        "clustering.fake.One": {
+            "module": "fake_prims_one",
+            "attr": "One",
+            "file": str(tmp_path / "fake_prims_one.py"),
+            "mtime": os.path.getmtime(tmp_path / "fake_prims_one.py"),
+        }
+    }
+    assert len(os.listdir(tmp_path / "cache" / "kf-d3m")) == 1
+    assert "fake_prims_one" not in sys.modules
+
+
+def test_cached_index_skips_metadata(fake_install, monkeypatch):
+    _entry_cache.load_index()
+
+    def _distribution():
+        raise AssertionError("metadata should not be read")
+
+    monkeypatch.setattr(_entry_cache, "_distribution", _distribution)
+    assert list(_entry_cache.load_index()) == ["clustering.fake.One"]
+    assert _entry_cache.load_primitive("clustering.fake.One").__name__ == "One"
+
+
+def test_stale_when_source_changes(fake_install, tmp_path):
+    _entry_cache.load_index()
+    source = tmp_path / "fake_prims_one.py"
+    mtime = os.path.getmtime(source) + 10
+    os.utime(source, (mtime, mtime))
+
+    assert _entry_cache.load_index()["clustering.fake.One"]["mtime"] == mtime
+
+
+def test_stale_when_entry_points_change(fake_install):
+    _entry_cache.load_index()
+
+    fake_install["targets"].append(("clustering.fake.Two", "fake_prims_two:Two"))
+    _write_entry_points(fake_install)
+    assert sorted(_entry_cache.load_index()) == [
+        "clustering.fake.One",
+        "clustering.fake.Two",
+    ]
+
+    fake_install["targets"].pop(0)
+    _write_entry_points(fake_install)
+    assert list(_entry_cache.load_index()) == ["clustering.fake.Two"]
+
+
+def test_stale_when_entry_points_file_is_removed(fake_install, tmp_path):
+    _entry_cache.load_index()
+    os.remove(fake_install["entry_points_file"])
+    fake_install["entry_points_file"] = None
+    fake_install["targets"].append(("clustering.fake.Two", "fake_prims_two:Two"))
+
+    assert sorted(_entry_cache.load_index()) == [
+        "clustering.fake.One",
+        "clustering.fake.Two",
+    ]
+
+
+def test_load_primitive(fake_install):
+    fake_install["targets"].append(("clustering.fake.Two", "fake_prims_two:Two"))
+
+    primitive = _entry_cache.load_primitive("d3m.primitives.clustering.fake.Two")
+
+    assert primitive.__name__ == "Two"
+    assert "fake_prims_two" in sys.modules
+    assert "fake_prims_one" not in sys.modules
+    assert _entry_cache.load_primitive("clustering.fake.Two") is primitive
+    with pytest.raises(KeyError):
+        _entry_cache.load_primitive("clustering.fake.Three")
+
+
+def test_load_primitive_with_relative_imports(fake_install):
+    fake_install["targets"].append(("clustering.fake.Three", "fake_pkg.prims:Three"))
+    _write_entry_points(fake_install)
+
+    primitive = _entry_cache.load_primitive("clustering.fake.Three")
+
+    assert primitive.value == 3
+    assert sys.modules["fake_pkg.prims"].Three is primitive
+
+
+def test_not_installed(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.setattr(_entry_cache, "DISTRIBUTION", "kf-d3m-primitives-missing")
+
+    with pytest.raises(LookupError, match="is not installed"):
+        _entry_cache._distribution()
+    assert _entry_cache.entry_points() == []
+    with pytest.raises(LookupError, match="is not installed"):
+        _entry_cache.load_index()
+    with pytest.raises(LookupError, match="is not installed"):
+        _entry_cache.load_primitive("clustering.fake.One")
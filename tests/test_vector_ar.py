@@ -0,0 +1,99 @@
+import numpy as np
+import pytest
+
+from kf_d3m_primitives.ts_forecasting.vector_autoregression.vector_ar import VectorAR
+
+# expected values were generated once with statsmodels 0.14 (statsmodels.tsa.api.VAR)
+# on the same series
+_t = np.arange(24)
+ENDOG = np.column_stack(
+    [np.sin(_t / 2.0) + 0.1 * _t, np.cos(_t / 3.0) + 0.05 * (_t % 5)]
+).round(6)
+
+PARAMS = np.array(
+    [
+        [0.2324616941, -0.1251074115],
+        [1.5606297337, 0.2209615817],
+        [0.3314010928, 1.3752775406],
+        [-0.7498589445, -0.1059054008],
+        [-0.3260070502, -0.5720311609],
+    ]
+)
+FORECAST = np.array(
+    [
+        [1.4724691362, 0.1832179801],
+        [1.4133386469, 0.1090304830],
+        [1.3104183260, 0.0763844780],
+    ]
+)
+FORECAST_VARS = np.array(
+    [
+        [0.0157357138, 0.0199889976],
+        [0.0621534548, 0.0620291197],
+        [0.1321787066, 0.1140491267],
+    ]
+)
+LOWER_90 = np.array(
+    [
+        [1.2661352868, -0.0493354579],
+        [1.0032668570, -0.3006309366],
+        [0.7124089328, -0.4791016768],
+    ]
+)
+UPPER_90 = np.array(
+    [
+        [1.6788029856, 0.4157714182],
+        [1.8234104367, 0.5186919026],
+        [1.9084277192, 0.6318706328],
+    ]
+)
+
+
+@pytest.mark.parametrize("maxlags", [3, 4, 5])
+def test_select_order(maxlags):
+    assert VectorAR(ENDOG).select_order(maxlags=maxlags) == maxlags
+
+
+def test_select_order_maxlags_too_large():
+    with pytest.raises(ValueError):
+        VectorAR(ENDOG).select_order(maxlags=8)
+
+
+def test_fit_params():
+    fit = VectorAR(ENDOG).fit(2)
+    np.testing.assert_allclose(fit.params, PARAMS, rtol=1e-8)
+    assert fit.k_ar == 2
+    assert fit.nobs == 22
+
+
+def test_forecast():
+    fit = VectorAR(ENDOG).fit(2)
+    np.testing.assert_allclose(fit.forecast(ENDOG[-2:], 3), FORECAST, rtol=1e-8)
+    np.testing.assert_allclose(fit.forecast_vars(3), FORECAST_VARS, rtol=1e-8)
+
+
+def test_forecast_interval():
+    mean, lower, upper = (
+        VectorAR(ENDOG).fit(2).forecast_interval(ENDOG[-2:], 3, alpha=0.1)
+    )
+    np.testing.assert_allclose(mean, FORECAST, rtol=1e-8)
+    np.testing.assert_allclose(lower, LOWER_90, rtol=1e-8)
+    np.testing.assert_allclose(upper, UPPER_90, rtol=1e-8)
+
+
+def test_constant_column():
+    endog = np.column_stack([ENDOG, np.full(len(ENDOG), 2.0)])
+    with pytest.raises(ValueError):
+        VectorAR(endog).select_order(maxlags=2)
+    with pytest.raises(ValueError):
+        VectorAR(endog).fit(1)
+
+
+def test_singular_residual_covariance():
+    endog = np.column_stack([ENDOG, ENDOG[:, 0]])
+    with pytest.raises(np.linalg.LinAlgError):
+        VectorAR(endog).select_order(maxlags=2)
+
+    # the fit itself falls back to the minimum norm least squares solution
+    fit = VectorAR(endog).fit(1)
+    np.testing.assert_allclose(fit.params[:, 0], fit.params[:, 2])